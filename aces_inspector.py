@@ -190,26 +190,15 @@ Return codes:
 
     # Connect to databases
     try:
-        if verbose:
-            print("connecting to VCdb")
-        result = vcdb.connect_local_oledb(vcdb_file)
-        if result:
-            print(f"VCdb connection failed: {result}")
-            return 4
-
-        if verbose:
-            print("connecting to PCdb")
-        result = pcdb.connect_local_oledb(pcdb_file)
-        if result:
-            print(f"PCdb connection failed: {result}")
-            return 4
-
-        if verbose:
-            print("connecting to Qdb")
-        result = qdb.connect_local_oledb(qdb_file)
-        if result:
-            print(f"Qdb connection failed: {result}")
-            return 4
+        for name, database, database_file in (("VCdb", vcdb, vcdb_file),
+                                              ("PCdb", pcdb, pcdb_file),
+                                              ("Qdb", qdb, qdb_file)):
+            if verbose:
+                print(f"connecting to {name}")
+            result = database.connect_local_oledb(database_file)
+            if result:
+                print(f"{name} connection failed: {result}")
+                return 4
 
     except Exception as ex:
         if verbose:
@@ -218,26 +207,15 @@ Return codes:
 
     # Import database data
     try:
-        if verbose:
-            print("importing VCdb data")
-        result = vcdb.import_oledb_data()
-        if result:
-            print(f"VCdb import failed: {result}")
-            return 5
-
-        if verbose:
-            print("importing PCdb data")
-        result = pcdb.import_oledb()
-        if result:
-            print(f"PCdb import failed: {result}")
-            return 5
-
-        if verbose:
-            print("importing Qdb data")
-        result = qdb.import_oledb()
-        if result:
-            print(f"Qdb import failed: {result}")
-            return 5
+        for name, import_data in (("VCdb", vcdb.import_oledb_data),
+                                  ("PCdb", pcdb.import_oledb),
+                                  ("Qdb", qdb.import_oledb)):
+            if verbose:
+                print(f"importing {name} data")
+            result = import_data()
+            if result:
+                print(f"{name} import failed: {result}")
+                return 5
 
     except Exception as ex:
         if verbose:
@@ -317,12 +295,12 @@ Return codes:
                 
                 # Add cache files to deletion list
                 cache_files_to_delete_on_exit.extend([
-                    f"{current_chunk.cache_file}_parttypePositionErrors{chunk_id}.txt",
-                    f"{current_chunk.cache_file}_QdbErrors{chunk_id}.txt",
-                    f"{current_chunk.cache_file}_questionableNotes{chunk_id}.txt",
-                    f"{current_chunk.cache_file}_invalidBasevehicles{chunk_id}.txt",
-                    f"{current_chunk.cache_file}_invalidVCdbCodes{chunk_id}.txt",
-                    f"{current_chunk.cache_file}_configurationErrors{chunk_id}.txt"
+                    current_chunk.fragment_file("parttypePositionErrors"),
+                    current_chunk.fragment_file("QdbErrors"),
+                    current_chunk.fragment_file("questionableNotes"),
+                    current_chunk.fragment_file("invalidBasevehicles"),
+                    current_chunk.fragment_file("invalidVCdbCodes"),
+                    current_chunk.fragment_file("configurationErrors")
                 ])
                 chunk_id += 1
             
@@ -346,9 +324,9 @@ Return codes:
             outlier_chunk.apps_list = aces.apps
             aces.outlier_analysis_chunks_list.append(outlier_chunk)
             cache_files_to_delete_on_exit.extend([
-                f"{outlier_chunk.cache_file}_qtyOutliers.txt",
-                f"{outlier_chunk.cache_file}_parttypeDisagreements.txt",
-                f"{outlier_chunk.cache_file}_assetProblems.txt"
+                outlier_chunk.fragment_file("qtyOutliers", numbered=False),
+                outlier_chunk.fragment_file("parttypeDisagreements", numbered=False),
+                outlier_chunk.fragment_file("assetProblems", numbered=False)
             ])
             
             outlier_future = executor.submit(aces.find_individual_app_outliers, outlier_chunk, vcdb, pcdb, qdb)
@@ -9,15 +9,14 @@ Author: Luke Smith (Original C#), Python Port
 import os
 import sys
 import re
+import string
 import hashlib
 import sqlite3
 from datetime import datetime
 from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
-import xml.etree.ElementTree as ET
 from xml.dom import minidom
-import pyodbc
 from lxml import etree
 import itertools
 from concurrent.futures import ThreadPoolExecutor
@@ -25,11 +24,342 @@ import tempfile
 import traceback
 
 
+# ODBC connection string for the Access (.mdb/.accdb) VCdb, PCdb and Qdb files
+_ACCESS_CONNECTION_STRING = "DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};DBQ=%s;"
+
+# One name:value pair of a CSS-style attribute string ("EngineBase:123;SubModel:45")
+_ATTRIBUTE_PAIR_RE = re.compile(r'([^;:]*):([^;]*)')
+
+# VCdb attribute elements of an App, in the order they are stored on the app
+_VCDB_ATTRIBUTE_NAMES = (
+    'SubModel', 'MfrBodyCode', 'BodyNumDoors', 'BodyType', 'DriveType',
+    'EngineBase', 'EngineDesignation', 'EngineVIN', 'EngineVersion', 'EngineMfr',
+    'PowerOutput', 'ValvesPerEngine', 'FuelDeliveryType', 'FuelDeliverySubType',
+    'FuelSystemControlType', 'FuelSystemDesign', 'Aspiration', 'CylinderHeadType',
+    'FuelType', 'IgnitionSystemType', 'TransmissionMfrCode', 'TransmissionBase',
+    'TransmissionType', 'TransmissionControlType', 'TransmissionNumSpeeds',
+    'TransElecControlled', 'TransmissionMfr', 'BedLength', 'BedType', 'WheelBase',
+    'BrakeSystem', 'FrontBrakeType', 'RearBrakeType', 'BrakeABS', 'FrontSpringType',
+    'RearSpringType', 'SteeringSystem', 'SteeringType', 'Region'
+)
+_VCDB_ATTRIBUTE_ORDER = {name: index for index, name in enumerate(_VCDB_ATTRIBUTE_NAMES)}
+
+# Sections of an ACES document that import_xml handles
+_ACES_IMPORT_TAGS = ('Header', 'App', 'Asset', 'Footer')
+
+# Document header and footer of an exported ACES XML file
+_EXPORT_HEADER_TMPL = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<ACES version="{version}">\n'
+    '  <Header>\n'
+    '    <Company>{company}</Company>\n'
+    '    <SenderName>{sender_name}</SenderName>\n'
+    '    <SenderPhone>{sender_phone}</SenderPhone>\n'
+    '    <TransferDate>{transfer_date}</TransferDate>\n'
+    '    <DocumentTitle>{document_title}</DocumentTitle>\n'
+    '    <EffectiveDate>{effective_date}</EffectiveDate>\n'
+    '    <SubmissionType>{submission_type}</SubmissionType>\n'
+    '    <VcdbVersionDate>{vcdb_version_date}</VcdbVersionDate>\n'
+    '    <QdbVersionDate>{qdb_version_date}</QdbVersionDate>\n'
+    '    <PcdbVersionDate>{pcdb_version_date}</PcdbVersionDate>\n'
+    '  </Header>\n'
+)
+_EXPORT_FOOTER_TMPL = '  <Footer>\n    <RecordCount>%d</RecordCount>\n  </Footer>\n</ACES>\n'
+
+# Static Excel XML preamble of the assessment file (workbook open, document
+# properties and styles). Only the <Created> timestamp varies per run.
+_ASSESSMENT_PREAMBLE_TMPL = (
+    b'<?xml version="1.0"?>'
+    b'<?mso-application progid="Excel.Sheet"?>'
+    b'<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet" '
+    b'xmlns:o="urn:schemas-microsoft-com:office:office" '
+    b'xmlns:x="urn:schemas-microsoft-com:office:excel" '
+    b'xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet" '
+    b'xmlns:html="http://www.w3.org/TR/REC-html40">'
+    b'<DocumentProperties xmlns="urn:schemas-microsoft-com:office:office">'
+    b'<Author>ACESinspector</Author>'
+    b'<LastAuthor>ACESinspector</LastAuthor>'
+    b'<Created>%sZ</Created>'
+    b'<Version>14.00</Version>'
+    b'</DocumentProperties>'
+    b'<Styles>'
+    b'<Style ss:ID="Default" ss:Name="Normal">'
+    b'<Alignment ss:Vertical="Bottom"/>'
+    b'<Borders/>'
+    b'<Font ss:FontName="Calibri" x:Family="Swiss" ss:Size="11" ss:Color="#000000"/>'
+    b'<Interior/>'
+    b'<NumberFormat/>'
+    b'<Protection/>'
+    b'</Style>'
+    b'<Style ss:ID="s62"><NumberFormat ss:Format="Short Date"/></Style>'
+    b'<Style ss:ID="s64" ss:Name="Hyperlink">'
+    b'<Font ss:FontName="Calibri" x:Family="Swiss" ss:Size="11" ss:Color="#0000FF" ss:Underline="Single"/>'
+    b'</Style>'
+    b'<Style ss:ID="s65">'
+    b'<Font ss:FontName="Calibri" x:Family="Swiss" ss:Size="11" ss:Color="#000000" ss:Bold="1"/>'
+    b'<Interior ss:Color="#D9D9D9" ss:Pattern="Solid"/>'
+    b'</Style>'
+    b'</Styles>'
+)
+
+# Stats worksheet of the assessment file, rendered in one substitution.
+# ${result_row} is either _STATS_RESULT_PASS or a rendered _STATS_RESULT_FAIL_TMPL.
+_STATS_TMPL = string.Template(
+    '<Worksheet ss:Name="Stats">'
+    '<Table ss:ExpandedColumnCount="3" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
+    '<Column ss:Width="170"/>'
+    '<Column ss:Width="171"/>'
+    '<Column ss:Width="144"/>'
+    '<Row><Cell><Data ss:Type="String">Input Filename</Data></Cell>'
+    '<Cell><Data ss:Type="String">${input_filename}</Data></Cell></Row>'
+    '<Row><Cell><Data ss:Type="String">Title</Data></Cell>'
+    '<Cell><Data ss:Type="String">${title}</Data></Cell></Row>'
+    '<Row><Cell><Data ss:Type="String">Brand</Data></Cell>'
+    '<Cell><Data ss:Type="String">${brand}</Data></Cell></Row>'
+    '<Row><Cell><Data ss:Type="String">ACES version</Data></Cell>'
+    '<Cell><Data ss:Type="String">${version}</Data></Cell></Row>'
+    '<Row><Cell><Data ss:Type="String">Application count</Data></Cell>'
+    '<Cell><Data ss:Type="Number">${app_count}</Data></Cell></Row>'
+    '<Row><Cell><Data ss:Type="String">Unique Part count</Data></Cell>'
+    '<Cell><Data ss:Type="Number">${part_count}</Data></Cell></Row>'
+    '${result_row}'
+    '<Row><Cell><Data ss:Type="String">All BaseVehicle Coverage (%)</Data></Cell>'
+    '<Cell><Data ss:Type="Number">${all_coverage}</Data></Cell>'
+    '<Cell><Data ss:Type="String">${basevehicle_hit_count} used, ${total_basevehicles} available</Data></Cell></Row>'
+    '<Row><Cell><Data ss:Type="String">1990+ BaseVehicle Coverage (%)</Data></Cell>'
+    '<Cell><Data ss:Type="Number">${modern_coverage}</Data></Cell>'
+    '<Cell><Data ss:Type="String">${modern_basevehicle_hit_count} used, ${modern_basevehicles_available} available</Data></Cell></Row>'
+    '<Row><Cell><Data ss:Type="String">Processing Time (Seconds)</Data></Cell>'
+    '<Cell><Data ss:Type="Number">${runtime}</Data></Cell></Row>'
+    '</Table></Worksheet>'
+)
+
+_STATS_RESULT_PASS = ('<Row><Cell><Data ss:Type="String">Result</Data></Cell>'
+                      '<Cell><Data ss:Type="String">Pass</Data></Cell></Row>')
+
+_STATS_RESULT_FAIL_TMPL = string.Template(
+    '<Row><Cell><Data ss:Type="String">Result</Data></Cell>'
+    '<Cell><Data ss:Type="String">Fail</Data></Cell>'
+    '<Cell><Data ss:Type="String">${failure_reasons}</Data></Cell></Row>'
+)
+
+# Translation table for escaping XML special characters in one str.translate() pass
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "'": "&apos;", '"': "&quot;"})
+
+# Cell markup used when emitting worksheet rows
+_CELL_TEMPLATE = '<Cell><Data ss:Type="String">%s</Data></Cell>'
+_ROW_START = '<Row><Cell><Data ss:Type="String">'
+_CELL_SEPARATOR = '</Data></Cell><Cell><Data ss:Type="String">'
+_ROW_END = '</Data></Cell></Row>'
+_HEADER_CELL_TEMPLATE = '<Cell ss:StyleID="s65"><Data ss:Type="String">%s</Data></Cell>'
+_WORKSHEET_CLOSE = b'</Table></Worksheet>'
+
+# Rows are flushed to the output file in batches of this size
+_WORKSHEET_FLUSH_ROWS = 4096
+
+# Buffer size for the binary assessment file writer
+_ASSESSMENT_WRITE_BUFFER_SIZE = 1 << 20
+
+# Buffer size for reading analysis fragment files back
+_FRAGMENT_READ_BUFFER_SIZE = 1 << 20
+
+# Column headings shared by the per-app error and warning worksheets
+_APP_COLUMNS = ("App Id", "Base Vehicle Id", "Make", "Model", "Year",
+                "Part Type", "Position", "Quantity", "Part")
+_FITMENT_COLUMNS = ("Fitment",)
+_ATTRIBUTE_COLUMNS = ("Attributes", "Notes")
+
+# Worksheets read back from analysis fragment files, in output order:
+# (ACES count attribute, chunk count attribute, worksheet name, headers, file suffix, numbered per chunk)
+_INDIVIDUAL_ERROR_WORKSHEETS = (
+    ("parttype_position_errors_count", "parttype_position_errors_count", "PartType-Position Errors",
+     ("Error",) + _APP_COLUMNS + _FITMENT_COLUMNS, "parttypePositionErrors", True),
+    ("qdb_errors_count", "qdb_errors_count", "Qdb Errors",
+     ("Error",) + _APP_COLUMNS + _ATTRIBUTE_COLUMNS, "QdbErrors", True),
+    ("questionable_notes_count", "questionable_notes_count", "Questionable Notes",
+     ("Error",) + _APP_COLUMNS + _ATTRIBUTE_COLUMNS, "questionableNotes", True),
+    ("basevehicleids_errors_count", "basevehicleids_errors_count", "Invalid BaseVehicles",
+     ("Error",) + _APP_COLUMNS + _FITMENT_COLUMNS, "invalidBasevehicles", True),
+    ("vcdb_codes_errors_count", "vcdb_codes_errors_count", "Invalid VCdb Codes",
+     ("Error",) + _APP_COLUMNS + _ATTRIBUTE_COLUMNS, "invalidVCdbCodes", True),
+    ("vcdb_configurations_errors_count", "vcdb_configurations_errors_count", "Configuration Errors",
+     ("Error",) + _APP_COLUMNS + _ATTRIBUTE_COLUMNS, "configurationErrors", True),
+)
+
+_OUTLIER_WORKSHEETS = (
+    ("qty_outlier_count", "qty_outlier_count", "Quantity Outliers",
+     ("Warning",) + _APP_COLUMNS + _FITMENT_COLUMNS, "qtyOutliers", False),
+    ("parttype_disagreement_count", "parttype_disagreement_errors_count", "Part Type Disagreements",
+     ("Warning",) + _APP_COLUMNS + _FITMENT_COLUMNS, "parttypeDisagreements", False),
+    ("asset_problems_count", "asset_problems_count", "Asset Problems",
+     ("Warning",) + _APP_COLUMNS + _FITMENT_COLUMNS, "assetProblems", False),
+)
+
+
+def _connect_access(path: str):
+    """Open an ODBC connection to an Access database (pyodbc is only needed once a database is opened)"""
+    import pyodbc
+    return pyodbc.connect(_ACCESS_CONNECTION_STRING % path)
+
+
+def _escape_xml(text) -> str:
+    """Escape XML special characters"""
+    if not text:
+        return ""
+    return str(text).translate(_XML_ESCAPE)
+
+
+def _worksheet_header(name: str, headers) -> bytes:
+    """Return the opening markup of a worksheet including its bold header row"""
+    parts = [f'<Worksheet ss:Name="{name}">'
+             f'<Table ss:ExpandedColumnCount="{len(headers)}" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
+             '<Row>']
+    for header in headers:
+        parts.append(_HEADER_CELL_TEMPLATE % header)
+    parts.append('</Row>')
+    return ''.join(parts).encode('utf-8')
+
+
+def _row_template(column_count: int) -> str:
+    """Return a %-template for a worksheet row of column_count string cells"""
+    return '<Row>' + _CELL_TEMPLATE * column_count + '</Row>'
+
+
+def _render_rows(rows, row_template: str) -> bytes:
+    """Render field rows through row_template as escaped UTF-8 worksheet markup"""
+    return ''.join([row_template % tuple([_escape_xml(field) for field in fields])
+                    for fields in rows]).encode('utf-8')
+
+
+def _render_error_fragment(error_file: str, field_count: int) -> str:
+    """Render the complete rows of an analysis fragment file as escaped worksheet row markup"""
+    try:
+        with open(error_file, 'r', encoding='utf-8', newline='', buffering=_FRAGMENT_READ_BUFFER_SIZE) as ef:
+            data = ef.read()
+    except FileNotFoundError:
+        return ""
+    except (OSError, UnicodeDecodeError) as ex:
+        print(f"Error reading fragment file {error_file}: {ex}")
+        return ""
+    
+    # Escape the whole file in one pass, then turn each line's tabs into cell boundaries.
+    # Short rows are skipped and fields beyond field_count are dropped.
+    rows = []
+    last_tab_count = field_count - 1
+    for line in data.translate(_XML_ESCAPE).split('\n'):
+        tab_count = line.count('\t')
+        if tab_count < last_tab_count:
+            continue
+        if tab_count > last_tab_count:
+            line = line.rsplit('\t', tab_count - last_tab_count)[0]
+        rows.append(line.replace('\t', _CELL_SEPARATOR))
+    
+    if not rows:
+        return ""
+    return _ROW_START + (_ROW_END + _ROW_START).join(rows) + _ROW_END
+
+
+def _write_fragment_worksheet(f, chunks: List['AnalysisChunk'], chunk_attr: str, name: str, headers,
+                              suffix: str, numbered: bool):
+    """Write a worksheet to a binary file from the fragment files of the chunks that recorded problems"""
+    f.write(_worksheet_header(name, headers))
+    for chunk in chunks:
+        if getattr(chunk, chunk_attr) > 0:
+            error_file = chunk.fragment_file(suffix, numbered)
+            f.write(_render_error_fragment(error_file, len(headers)).encode('utf-8'))
+    f.write(_WORKSHEET_CLOSE)
+
+
+def _emit_worksheet(f, name: str, headers, rows):
+    """Write a worksheet (bold header row, then one string cell per field) to a binary file"""
+    f.write(_worksheet_header(name, headers))
+    row_template = _row_template(len(headers))
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, _WORKSHEET_FLUSH_ROWS))
+        if not batch:
+            break
+        f.write(_render_rows(batch, row_template))
+    f.write(_WORKSHEET_CLOSE)
+
+
+def _parse_app_basevehicle(app: 'App', node):
+    """Set an app's BaseVehicle id from its element"""
+    app.basevehicle_id = int(node.get('id', '0'))
+    app.type = 1  # basevehicle type
+
+
+def _parse_app_qty(app: 'App', node):
+    """Set an app's quantity from its Qty element (0 if unparseable)"""
+    try:
+        app.quantity = int(node.text or '0')
+    except ValueError:
+        app.quantity = 0
+
+
+def _parse_app_parttype(app: 'App', node):
+    """Set an app's PartType id from its element"""
+    app.parttype_id = int(node.get('id', '0'))
+
+
+def _parse_app_position(app: 'App', node):
+    """Set an app's Position id from its element"""
+    app.position_id = int(node.get('id', '0'))
+
+
+def _parse_app_part(app: 'App', node):
+    """Set an app's Part number and brand from its element"""
+    app.part = node.text or ''
+    app.brand = node.get('BrandAAIAID', '')
+
+
+def _parse_app_mfr_label(app: 'App', node):
+    """Set an app's MfrLabel from its element"""
+    app.mfr_label = node.text or ''
+
+
+def _parse_app_asset_name(app: 'App', node):
+    """Set an app's AssetName from its element"""
+    app.asset = node.text or ''
+
+
+def _parse_app_asset_item_order(app: 'App', node):
+    """Set an app's asset item order from its AssetItemOrder element (0 if unparseable)"""
+    try:
+        app.asset_item_order = int(node.text or '0')
+    except ValueError:
+        app.asset_item_order = 0
+
+
+def _parse_app_asset_item_ref(app: 'App', node):
+    """Set an app's AssetItemRef from its element"""
+    app.asset_item_ref = node.text or ''
+
+
+# Parsers for the single-occurrence (non VCdb attribute) children of an App element
+_APP_CHILD_PARSERS = {
+    'BaseVehicle': _parse_app_basevehicle,
+    'Qty': _parse_app_qty,
+    'PartType': _parse_app_parttype,
+    'Position': _parse_app_position,
+    'Part': _parse_app_part,
+    'MfrLabel': _parse_app_mfr_label,
+    'AssetName': _parse_app_asset_name,
+    'AssetItemOrder': _parse_app_asset_item_order,
+    'AssetItemRef': _parse_app_asset_item_ref,
+}
+
+
 @dataclass
 class VCdbAttribute:
     """Represents a VCdb attribute with name and value"""
-    name: str = ""
-    value: int = 0
+    __slots__ = ('name', 'value')
+    name: str
+    value: int
+    
+    def __init__(self, name: str = "", value: int = 0):
+        self.name = name
+        self.value = value
     
     def __lt__(self, other):
         """For sorting VCdbAttribute objects"""
@@ -41,8 +371,9 @@ class VCdbAttribute:
 @dataclass
 class QdbQualifier:
     """Represents a Qdb qualifier with ID and parameters"""
-    qualifier_id: int = 0
-    qualifier_parameters: List[str] = field(default_factory=list)
+    __slots__ = ('qualifier_id', 'qualifier_parameters')
+    qualifier_id: int
+    qualifier_parameters: List[str]
     
     def __init__(self):
         self.qualifier_id = 0
@@ -112,6 +443,10 @@ class AnalysisChunk:
     apps_list: List['App'] = field(default_factory=list)
     problem_apps_list: List['App'] = field(default_factory=list)
     lowest_badness_permutation: List[str] = field(default_factory=list)
+    
+    def fragment_file(self, suffix: str, numbered: bool = True) -> str:
+        """Returns the path of this chunk's analysis fragment file for suffix"""
+        return f"{self.cache_file}_{suffix}{self.id if numbered else ''}.txt"
 
 
 @dataclass
@@ -123,6 +458,7 @@ class AnalysisChunkGroup:
 
 class Asset:
     """Represents an asset from ACES XML"""
+    __slots__ = ('id', 'action', 'basevehicle_id', 'asset_name', 'vcdb_attributes', 'qdb_qualifiers', 'notes')
     
     def __init__(self):
         self.id = 0
@@ -155,14 +491,17 @@ class Asset:
     
     def nice_qdb_qualifier_string(self, qdb: 'Qdb') -> str:
         """Returns human-readable Qdb qualifier string"""
-        result = ""
-        for qualifier in self.qdb_qualifiers:
-            result += qdb.nice_qdb_qualifier(qualifier.qualifier_id, qualifier.qualifier_parameters)
-        return result
+        return "".join(qdb.nice_qdb_qualifier(qualifier.qualifier_id, qualifier.qualifier_parameters)
+                       for qualifier in self.qdb_qualifiers)
 
 
 class App:
     """Represents an application from ACES XML"""
+    __slots__ = ('id', 'type', 'reference', 'action', 'validate', 'basevehicle_id', 'parttype_id',
+                 'position_id', 'quantity', 'part', 'mfr_label', 'asset', 'asset_item_order',
+                 'asset_item_ref', 'vcdb_attributes', 'qdb_qualifiers', 'notes',
+                 'contains_vcdb_violation', 'has_been_validated', 'problems_found', 'hash',
+                 'brand', 'subbrand')
     
     def __init__(self):
         self.id = 0
@@ -227,13 +566,13 @@ class App:
     
     def raw_qdb_data_string(self) -> str:
         """Returns raw Qdb data string"""
-        result = ""
+        parts = []
         for qualifier in self.qdb_qualifiers:
-            result += str(qualifier.qualifier_id)
+            parts.append(str(qualifier.qualifier_id))
             for param in qualifier.qualifier_parameters:
-                result += f":{param}"
-            result += ";"
-        return result
+                parts.append(f":{param}")
+            parts.append(";")
+        return "".join(parts)
     
     def nice_qdb_qualifier_string(self, qdb: 'Qdb') -> str:
         """Returns human-readable Qdb qualifier string"""
@@ -259,10 +598,12 @@ class App:
     
     def app_hash(self) -> str:
         """Generate hash for this app"""
-        content = (f"{self.basevehicle_id}{self.parttype_id}{self.position_id}{self.quantity}"
-                  f"{self.name_val_pair_string(True)}{self.raw_qdb_data_string()}"
-                  f"{self.mfr_label}{self.part}{self.asset}{self.asset_item_order}{self.brand}{self.subbrand}")
-        return hashlib.md5(content.encode()).hexdigest()
+        md5 = hashlib.md5(f"{self.basevehicle_id}{self.parttype_id}{self.position_id}{self.quantity}".encode())
+        md5.update(self.name_val_pair_string(True).encode())
+        md5.update(self.raw_qdb_data_string().encode())
+        md5.update(f"{self.mfr_label}{self.part}{self.asset}{self.asset_item_order}"
+                   f"{self.brand}{self.subbrand}".encode())
+        return md5.hexdigest()
     
     def __lt__(self, other):
         """For sorting App objects"""
@@ -339,6 +680,17 @@ class VCdb:
         self.valves_dict: Dict[int, str] = {}
         self.poweroutput_dict: Dict[int, str] = {}
         
+        # Attribute name -> lookup table, so nice/valid checks are one dict probe
+        self._nice_attribute_tables: Dict[str, Dict[int, str]] = {
+            "EngineBase": self.enginebase_dict,
+            "SubModel": self.submodel_dict,
+            "DriveType": self.drivetype_dict,
+        }
+        self._validated_attribute_tables: Dict[str, Dict[int, str]] = {
+            "EngineBase": self.enginebase_dict,
+            "SubModel": self.submodel_dict,
+        }
+        
         self.deleted_engine_base_dict: Dict[int, List[Tuple[str, str]]] = {}
     
     def connect_local_oledb(self, path: str) -> str:
@@ -349,9 +701,7 @@ class VCdb:
             if self.connection_oledb:
                 self.connection_oledb.close()
             
-            # Use pyodbc to connect to Access database
-            connection_string = f"DRIVER={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={path};"
-            self.connection_oledb = pyodbc.connect(connection_string)
+            self.connection_oledb = _connect_access(path)
         except Exception as ex:
             result = str(ex)
         return result
@@ -373,23 +723,18 @@ class VCdb:
     
     def nice_attribute(self, attribute: VCdbAttribute) -> str:
         """Return human-readable attribute string"""
-        if attribute.name == "EngineBase" and attribute.value in self.enginebase_dict:
-            return self.enginebase_dict[attribute.value]
-        elif attribute.name == "SubModel" and attribute.value in self.submodel_dict:
-            return self.submodel_dict[attribute.value]
-        elif attribute.name == "DriveType" and attribute.value in self.drivetype_dict:
-            return self.drivetype_dict[attribute.value]
-        # Add more attribute type mappings...
-        else:
-            return f"{attribute.name}:{attribute.value}"
+        table = self._nice_attribute_tables.get(attribute.name)
+        if table is not None:
+            nice = table.get(attribute.value)
+            if nice is not None:
+                return nice
+        return f"{attribute.name}:{attribute.value}"
     
     def valid_attribute(self, attribute: VCdbAttribute) -> bool:
         """Check if attribute is valid"""
-        if attribute.name == "EngineBase":
-            return attribute.value in self.enginebase_dict
-        elif attribute.name == "SubModel":
-            return attribute.value in self.submodel_dict
-        # Add more validation logic...
+        table = self._validated_attribute_tables.get(attribute.name)
+        if table is not None:
+            return attribute.value in table
         return True
     
     def nice_make_of_basevid(self, base_vid: int) -> str:
@@ -441,7 +786,7 @@ class VCdb:
             
             # Import base vehicles
             cursor.execute("SELECT BaseVehicleID, MakeID, ModelID, Year FROM BaseVehicle")
-            for row in cursor.fetchall():
+            for row in cursor:
                 base_vehicle = BaseVehicle()
                 base_vehicle.id = row[0]
                 base_vehicle.make_id = row[1]
@@ -451,22 +796,22 @@ class VCdb:
             
             # Import manufacturers
             cursor.execute("SELECT MfrID, MfrName FROM Mfr")
-            for row in cursor.fetchall():
+            for row in cursor:
                 self.mfr_dict[row[0]] = row[1]
             
             # Import engine bases
             cursor.execute("SELECT EngineBaseID, EngineBaseName FROM EngineBase")
-            for row in cursor.fetchall():
+            for row in cursor:
                 self.enginebase_dict[row[0]] = row[1]
             
             # Import submodels
             cursor.execute("SELECT SubModelID, SubModelName FROM SubModel")
-            for row in cursor.fetchall():
+            for row in cursor:
                 self.submodel_dict[row[0]] = row[1]
             
             # Import drive types
             cursor.execute("SELECT DriveTypeID, DriveTypeName FROM DriveType")
-            for row in cursor.fetchall():
+            for row in cursor:
                 self.drivetype_dict[row[0]] = row[1]
             
             # Add more imports for other lookup tables...
@@ -509,17 +854,17 @@ class PCdb:
             
             # Import part types
             cursor.execute("SELECT partterminologyid, partterminologyname FROM Parts")
-            for row in cursor.fetchall():
+            for row in cursor:
                 self.parttypes[row[0]] = row[1]
             
             # Import positions
             cursor.execute("SELECT PositionID, [Position] FROM Positions")
-            for row in cursor.fetchall():
+            for row in cursor:
                 self.positions[row[0]] = row[1]
             
             # Import codemaster combinations
             cursor.execute("SELECT partterminologyid, positionid FROM codemaster")
-            for row in cursor.fetchall():
+            for row in cursor:
                 self.codemaster_parttype_positions.append(f"{row[0]}_{row[1]}")
             
             self.import_success = True
@@ -538,8 +883,7 @@ class PCdb:
             if self.connection_oledb:
                 self.connection_oledb.close()
             
-            connection_string = f"DRIVER={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={path};"
-            self.connection_oledb = pyodbc.connect(connection_string)
+            self.connection_oledb = _connect_access(path)
         except Exception as ex:
             result = str(ex)
         return result
@@ -595,7 +939,7 @@ class Qdb:
             
             # Import qualifiers
             cursor.execute("SELECT qualifierid, qualifiertext, qualifiertypeid FROM Qualifier ORDER BY qualifierid")
-            for row in cursor.fetchall():
+            for row in cursor:
                 qualifier_id = row[0]
                 self.qualifiers[qualifier_id] = row[1]
                 qualifier_type_id = 0
@@ -621,8 +965,7 @@ class Qdb:
             if self.connection_oledb:
                 self.connection_oledb.close()
             
-            connection_string = f"DRIVER={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={path};"
-            self.connection_oledb = pyodbc.connect(connection_string)
+            self.connection_oledb = _connect_access(path)
         except Exception as ex:
             result = str(ex)
         return result
@@ -795,17 +1138,14 @@ class ACES:
         if not name_value_pairs_string:
             return attributes
         
-        pairs = name_value_pairs_string.split(';')
-        for pair in pairs:
-            if ':' in pair:
-                name, value = pair.split(':', 1)
-                try:
-                    attr = VCdbAttribute()
-                    attr.name = name.strip()
-                    attr.value = int(value.strip())
-                    attributes.append(attr)
-                except ValueError:
-                    continue
+        for name, value in _ATTRIBUTE_PAIR_RE.findall(name_value_pairs_string):
+            try:
+                attr = VCdbAttribute()
+                attr.name = sys.intern(name.strip())
+                attr.value = int(value)
+                attributes.append(attr)
+            except ValueError:
+                continue
         
         return attributes
     
@@ -817,53 +1157,62 @@ class ACES:
             self.file_path = file_path
             self.clear()
             
-            # Parse XML
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # Get version
-            self.version = root.get('version', '')
-            
-            # Parse header
-            header = root.find('Header')
-            if header is not None:
-                self.company = header.findtext('Company', '')
-                self.sender_name = header.findtext('SenderName', '')
-                self.sender_phone = header.findtext('SenderPhone', '')
-                self.transfer_date = header.findtext('TransferDate', '')
-                self.document_title = header.findtext('DocumentTitle', '')
-                self.effective_date = header.findtext('EffectiveDate', '')
-                self.submission_type = header.findtext('SubmissionType', '')
-                self.vcdb_version_date = header.findtext('VcdbVersionDate', '')
-                self.qdb_version_date = header.findtext('QdbVersionDate', '')
-                self.pcdb_version_date = header.findtext('PcdbVersionDate', '')
-            
-            # Parse applications
-            app_nodes = root.findall('App')
-            self.xml_app_node_count = len(app_nodes)
-            
-            for app_node in app_nodes:
-                app = self._parse_app_node(app_node)
-                if app:
-                    self.apps.append(app)
+            # Stream the document, dropping each top-level element once it has been
+            # parsed, so only one App/Asset subtree is held in memory at a time. lxml
+            # applies the tag filter in C, so the App/Asset children raise no events.
+            # Internal DTD entities are expanded; external ones are never loaded.
+            context = etree.iterparse(file_path, events=('end',), tag=_ACES_IMPORT_TAGS,
+                                      resolve_entities='internal')
+            root = None
+            
+            # Collect into locals and publish once the document has been read
+            apps: List[App] = []
+            assets: List[Asset] = []
+            app_node_count = 0
+            asset_node_count = 0
+            for _, element in context:
+                if root is None:
+                    # Get version before the root is cleared
+                    root = element.getroottree().getroot()
+                    self.version = root.get('version', '')
+                tag = element.tag
+                if tag == 'App':
+                    app_node_count += 1
+                    app = self._parse_app_node(element)
+                    if app:
+                        apps.append(app)
+                elif tag == 'Asset':
+                    asset_node_count += 1
+                    asset = self._parse_asset_node(element)
+                    if asset:
+                        assets.append(asset)
+                elif tag == 'Header':
+                    self.company = element.findtext('Company', '')
+                    self.sender_name = element.findtext('SenderName', '')
+                    self.sender_phone = element.findtext('SenderPhone', '')
+                    self.transfer_date = element.findtext('TransferDate', '')
+                    self.document_title = element.findtext('DocumentTitle', '')
+                    self.effective_date = element.findtext('EffectiveDate', '')
+                    self.submission_type = element.findtext('SubmissionType', '')
+                    self.vcdb_version_date = element.findtext('VcdbVersionDate', '')
+                    self.qdb_version_date = element.findtext('QdbVersionDate', '')
+                    self.pcdb_version_date = element.findtext('PcdbVersionDate', '')
+                elif tag == 'Footer':
+                    record_count = element.findtext('RecordCount', '0')
+                    try:
+                        self.footer_record_count = int(record_count)
+                    except ValueError:
+                        self.footer_record_count = 0
+                root.clear()
             
-            # Parse assets
-            asset_nodes = root.findall('Asset')
-            self.xml_asset_node_count = len(asset_nodes)
+            if root is None:
+                # No recognised sections (e.g. a namespaced root); the parser still exposes the root
+                self.version = context.root.get('version', '')
             
-            for asset_node in asset_nodes:
-                asset = self._parse_asset_node(asset_node)
-                if asset:
-                    self.assets.append(asset)
-            
-            # Parse footer
-            footer = root.find('Footer')
-            if footer is not None:
-                record_count = footer.findtext('RecordCount', '0')
-                try:
-                    self.footer_record_count = int(record_count)
-                except ValueError:
-                    self.footer_record_count = 0
+            self.apps = apps
+            self.assets = assets
+            self.xml_app_node_count = app_node_count
+            self.xml_asset_node_count = asset_node_count
             
             self.successful_import = True
             
@@ -892,88 +1241,46 @@ class ACES:
             validate_attr = app_node.get('validate', 'yes')
             app.validate = validate_attr.lower() == 'yes'
             
-            # Parse base vehicle or year range
-            base_vehicle = app_node.find('BaseVehicle')
-            if base_vehicle is not None:
-                app.basevehicle_id = int(base_vehicle.get('id', '0'))
-                app.type = 1  # basevehicle type
-            else:
-                # Handle year range style
-                years = app_node.find('Years')
-                make = app_node.find('Make')
-                if years is not None and make is not None:
-                    app.type = 1  # Will be converted to basevehicle type
-                    # Implementation would convert year range to basevehicle IDs
-            
-            # Parse part information
-            qty_node = app_node.find('Qty')
-            if qty_node is not None:
-                try:
-                    app.quantity = int(qty_node.text or '0')
-                except ValueError:
-                    app.quantity = 0
-            
-            parttype_node = app_node.find('PartType')
-            if parttype_node is not None:
-                app.parttype_id = int(parttype_node.get('id', '0'))
-            
-            position_node = app_node.find('Position')
-            if position_node is not None:
-                app.position_id = int(position_node.get('id', '0'))
-            
-            part_node = app_node.find('Part')
-            if part_node is not None:
-                app.part = part_node.text or ''
-                app.brand = part_node.get('BrandAAIAID', '')
-            
-            mfr_label_node = app_node.find('MfrLabel')
-            if mfr_label_node is not None:
-                app.mfr_label = mfr_label_node.text or ''
-            
-            # Parse asset information
-            asset_name_node = app_node.find('AssetName')
-            if asset_name_node is not None:
-                app.asset = asset_name_node.text or ''
-            
-            asset_order_node = app_node.find('AssetItemOrder')
-            if asset_order_node is not None:
-                try:
-                    app.asset_item_order = int(asset_order_node.text or '0')
-                except ValueError:
-                    app.asset_item_order = 0
-            
-            asset_ref_node = app_node.find('AssetItemRef')
-            if asset_ref_node is not None:
-                app.asset_item_ref = asset_ref_node.text or ''
-            
-            # Parse VCdb attributes (all the vehicle attribute nodes)
-            vcdb_attribute_names = [
-                'SubModel', 'MfrBodyCode', 'BodyNumDoors', 'BodyType', 'DriveType',
-                'EngineBase', 'EngineDesignation', 'EngineVIN', 'EngineVersion', 'EngineMfr',
-                'PowerOutput', 'ValvesPerEngine', 'FuelDeliveryType', 'FuelDeliverySubType',
-                'FuelSystemControlType', 'FuelSystemDesign', 'Aspiration', 'CylinderHeadType',
-                'FuelType', 'IgnitionSystemType', 'TransmissionMfrCode', 'TransmissionBase',
-                'TransmissionType', 'TransmissionControlType', 'TransmissionNumSpeeds',
-                'TransElecControlled', 'TransmissionMfr', 'BedLength', 'BedType', 'WheelBase',
-                'BrakeSystem', 'FrontBrakeType', 'RearBrakeType', 'BrakeABS', 'FrontSpringType',
-                'RearSpringType', 'SteeringSystem', 'SteeringType', 'Region'
-            ]
-            
-            for attr_name in vcdb_attribute_names:
-                attr_node = app_node.find(attr_name)
-                if attr_node is not None:
-                    attr_id = attr_node.get('id')
-                    if attr_id:
-                        try:
-                            vcdb_attr = VCdbAttribute()
-                            vcdb_attr.name = attr_name
-                            vcdb_attr.value = int(attr_id)
-                            app.vcdb_attributes.append(vcdb_attr)
-                        except ValueError:
-                            continue
+            # Index the children in one sweep; as with find(), the first occurrence of a tag wins
+            child_nodes = {}
+            qual_nodes = []
+            note_nodes = []
+            for child in app_node:
+                tag = child.tag
+                if tag == 'Qual':
+                    qual_nodes.append(child)
+                elif tag == 'Note':
+                    note_nodes.append(child)
+                elif tag not in child_nodes:
+                    child_nodes[tag] = child
+            
+            # Apply each element's parser with one dict probe per distinct tag. Years/Make
+            # style apps keep the default basevehicle type; converting year ranges to
+            # basevehicle IDs is not implemented.
+            attribute_nodes = []
+            for tag, node in child_nodes.items():
+                parser = _APP_CHILD_PARSERS.get(tag)
+                if parser is not None:
+                    parser(app, node)
+                else:
+                    order = _VCDB_ATTRIBUTE_ORDER.get(tag)
+                    if order is not None:
+                        attribute_nodes.append((order, node))
+            
+            # Parse VCdb attributes in canonical order (the order feeds app_hash)
+            attribute_nodes.sort(key=lambda item: item[0])
+            for order, attr_node in attribute_nodes:
+                attr_id = attr_node.get('id')
+                if attr_id:
+                    try:
+                        vcdb_attr = VCdbAttribute()
+                        vcdb_attr.name = _VCDB_ATTRIBUTE_NAMES[order]
+                        vcdb_attr.value = int(attr_id)
+                        app.vcdb_attributes.append(vcdb_attr)
+                    except ValueError:
+                        continue
             
             # Parse Qdb qualifiers
-            qual_nodes = app_node.findall('Qual')
             for qual_node in qual_nodes:
                 qual_id = qual_node.get('id')
                 if qual_id:
@@ -992,7 +1299,6 @@ class ACES:
                         continue
             
             # Parse notes
-            note_nodes = app_node.findall('Note')
             for note_node in note_nodes:
                 if note_node.text:
                     app.notes.append(note_node.text)
@@ -1012,15 +1318,23 @@ class ACES:
             asset.id = int(asset_node.get('id', '0'))
             asset.action = asset_node.get('action', 'A')
             
-            # Parse asset name
-            asset_name_node = asset_node.find('AssetName')
-            if asset_name_node is not None:
-                asset.asset_name = asset_name_node.text or ''
-            
-            # Parse base vehicle
-            base_vehicle = asset_node.find('BaseVehicle')
-            if base_vehicle is not None:
-                asset.basevehicle_id = int(base_vehicle.get('id', '0'))
+            # Parse asset name, base vehicle and notes in one sweep of the children
+            # (the first AssetName/BaseVehicle wins, as with find())
+            asset_name_node = None
+            base_vehicle = None
+            for child in asset_node:
+                tag = child.tag
+                if tag == 'Note':
+                    if child.text:
+                        asset.notes.append(child.text)
+                elif tag == 'AssetName':
+                    if asset_name_node is None:
+                        asset_name_node = child
+                        asset.asset_name = child.text or ''
+                elif tag == 'BaseVehicle':
+                    if base_vehicle is None:
+                        base_vehicle = child
+                        asset.basevehicle_id = int(child.get('id', '0'))
             
             # Parse VCdb attributes (similar to app parsing)
             # ... (implementation similar to app node parsing)
@@ -1028,12 +1342,6 @@ class ACES:
             # Parse Qdb qualifiers
             # ... (implementation similar to app node parsing)
             
-            # Parse notes
-            note_nodes = asset_node.findall('Note')
-            for note_node in note_nodes:
-                if note_node.text:
-                    asset.notes.append(note_node.text)
-            
             return asset
             
         except Exception as ex:
@@ -1045,47 +1353,44 @@ class ACES:
         
         # PartType/Position errors
         self.log_history_event("", "Looking for parttype/position errors")
-        cache_filename = f"{chunk.cache_file}_parttypePositionErrors{chunk.id}.txt"
+        cache_filename = chunk.fragment_file("parttypePositionErrors")
         
         try:
-            with open(cache_filename, 'w', encoding='utf-8') as f:
-                for app in chunk.apps_list:
-                    if app.action == "D":  # Ignore "Delete" apps
-                        continue
-                    
-                    error_string = ""
-                    
-                    # Check if parttype ID is valid
-                    if pcdb.nice_parttype(app.parttype_id) == str(app.parttype_id):
-                        error_string = "Invalid Parttype"
-                    
-                    # Check if position ID is valid
-                    if app.position_id != 0 and pcdb.nice_position(app.position_id) == str(app.position_id):
-                        error_string += " Invalid Position"
-                    
-                    # Check if parttype-position combination is valid
-                    if (error_string == "" and app.position_id != 0 and 
-                        f"{app.parttype_id}_{app.position_id}" not in pcdb.codemaster_parttype_positions):
-                        error_string = "Invalid Parttype-Position"
-                    
-                    if error_string:
-                        chunk.parttype_position_errors_count += 1
-                        problem_data = (f"{error_string}\t{app.id}\t{app.basevehicle_id}\t"
-                                      f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
-                                      f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
-                                      f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
-                                      f"{pcdb.nice_parttype(app.parttype_id)}\t"
-                                      f"{pcdb.nice_position(app.position_id)}\t"
-                                      f"{app.quantity}\t{app.part}\t"
-                                      f"{app.nice_full_fitment_string(vcdb, qdb)}")
-                        f.write(problem_data + "\n")
-            
-            if chunk.parttype_position_errors_count == 0:
-                try:
-                    os.remove(cache_filename)
-                except:
-                    pass
-            else:
+            rows = []
+            for app in chunk.apps_list:
+                if app.action == "D":  # Ignore "Delete" apps
+                    continue
+                
+                error_string = ""
+                
+                # Check if parttype ID is valid
+                if pcdb.nice_parttype(app.parttype_id) == str(app.parttype_id):
+                    error_string = "Invalid Parttype"
+                
+                # Check if position ID is valid
+                if app.position_id != 0 and pcdb.nice_position(app.position_id) == str(app.position_id):
+                    error_string += " Invalid Position"
+                
+                # Check if parttype-position combination is valid
+                if (error_string == "" and app.position_id != 0 and 
+                    f"{app.parttype_id}_{app.position_id}" not in pcdb.codemaster_parttype_positions):
+                    error_string = "Invalid Parttype-Position"
+                
+                if error_string:
+                    chunk.parttype_position_errors_count += 1
+                    problem_data = (f"{error_string}\t{app.id}\t{app.basevehicle_id}\t"
+                                  f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
+                                  f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
+                                  f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
+                                  f"{pcdb.nice_parttype(app.parttype_id)}\t"
+                                  f"{pcdb.nice_position(app.position_id)}\t"
+                                  f"{app.quantity}\t{app.part}\t"
+                                  f"{app.nice_full_fitment_string(vcdb, qdb)}")
+                    rows.append(problem_data)
+            
+            if rows:
+                with open(cache_filename, 'wb') as f:
+                    f.write(("\n".join(rows) + "\n").encode('utf-8'))
                 self.log_history_event("", f"Error: {chunk.parttype_position_errors_count} invalid parttypes or parttype/positions combinations (task {chunk.id})")
         
         except Exception as ex:
@@ -1093,34 +1398,31 @@ class ACES:
         
         # Qdb errors
         self.log_history_event("", "Looking for Qdb errors")
-        cache_filename = f"{chunk.cache_file}_QdbErrors{chunk.id}.txt"
+        cache_filename = chunk.fragment_file("QdbErrors")
         
         try:
-            with open(cache_filename, 'w', encoding='utf-8') as f:
-                for app in chunk.apps_list:
-                    if app.action == "D":
-                        continue
-                    
-                    for qdb_qualifier in app.qdb_qualifiers:
-                        if qdb.nice_qdb_qualifier(qdb_qualifier.qualifier_id, qdb_qualifier.qualifier_parameters) == str(qdb_qualifier.qualifier_id):
-                            chunk.qdb_errors_count += 1
-                            problem_data = (f"Invalid Qdb id ({qdb_qualifier.qualifier_id})\t{app.id}\t"
-                                          f"{app.basevehicle_id}\t{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
-                                          f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
-                                          f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
-                                          f"{pcdb.nice_parttype(app.parttype_id)}\t"
-                                          f"{pcdb.nice_position(app.position_id)}\t"
-                                          f"{app.quantity}\t{app.part}\t"
-                                          f"{app.nice_attributes_string(vcdb, False)}\t"
-                                          f"{';'.join(app.notes)}")
-                            f.write(problem_data + "\n")
+            rows = []
+            for app in chunk.apps_list:
+                if app.action == "D":
+                    continue
+                
+                for qdb_qualifier in app.qdb_qualifiers:
+                    if qdb.nice_qdb_qualifier(qdb_qualifier.qualifier_id, qdb_qualifier.qualifier_parameters) == str(qdb_qualifier.qualifier_id):
+                        chunk.qdb_errors_count += 1
+                        problem_data = (f"Invalid Qdb id ({qdb_qualifier.qualifier_id})\t{app.id}\t"
+                                      f"{app.basevehicle_id}\t{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
+                                      f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
+                                      f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
+                                      f"{pcdb.nice_parttype(app.parttype_id)}\t"
+                                      f"{pcdb.nice_position(app.position_id)}\t"
+                                      f"{app.quantity}\t{app.part}\t"
+                                      f"{app.nice_attributes_string(vcdb, False)}\t"
+                                      f"{';'.join(app.notes)}")
+                        rows.append(problem_data)
             
-            if chunk.qdb_errors_count == 0:
-                try:
-                    os.remove(cache_filename)
-                except:
-                    pass
-            else:
+            if rows:
+                with open(cache_filename, 'wb') as f:
+                    f.write(("\n".join(rows) + "\n").encode('utf-8'))
                 self.log_history_event("", f"Error: {chunk.qdb_errors_count} invalid Qdb references (task {chunk.id})")
         
         except Exception as ex:
@@ -1128,35 +1430,32 @@ class ACES:
         
         # Questionable Notes
         self.log_history_event("", "Looking for Questionable Notes")
-        cache_filename = f"{chunk.cache_file}_questionableNotes{chunk.id}.txt"
+        cache_filename = chunk.fragment_file("questionableNotes")
         
         try:
-            with open(cache_filename, 'w', encoding='utf-8') as f:
-                for app in chunk.apps_list:
-                    if app.action == "D":
-                        continue
-                    
-                    for search_term, exact_match in self.note_blacklist.items():
-                        for note in app.notes:
-                            if (exact_match and note == search_term) or (not exact_match and search_term in note):
-                                chunk.questionable_notes_count += 1
-                                problem_data = (f"Questionable note ({note})\t{app.id}\t{app.basevehicle_id}\t"
-                                              f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
-                                              f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
-                                              f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
-                                              f"{pcdb.nice_parttype(app.parttype_id)}\t"
-                                              f"{pcdb.nice_position(app.position_id)}\t"
-                                              f"{app.quantity}\t{app.part}\t"
-                                              f"{app.nice_attributes_string(vcdb, False)}\t"
-                                              f"{';'.join(app.notes)}")
-                                f.write(problem_data + "\n")
+            rows = []
+            for app in chunk.apps_list:
+                if app.action == "D":
+                    continue
+                
+                for search_term, exact_match in self.note_blacklist.items():
+                    for note in app.notes:
+                        if (exact_match and note == search_term) or (not exact_match and search_term in note):
+                            chunk.questionable_notes_count += 1
+                            problem_data = (f"Questionable note ({note})\t{app.id}\t{app.basevehicle_id}\t"
+                                          f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
+                                          f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
+                                          f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
+                                          f"{pcdb.nice_parttype(app.parttype_id)}\t"
+                                          f"{pcdb.nice_position(app.position_id)}\t"
+                                          f"{app.quantity}\t{app.part}\t"
+                                          f"{app.nice_attributes_string(vcdb, False)}\t"
+                                          f"{';'.join(app.notes)}")
+                            rows.append(problem_data)
             
-            if chunk.questionable_notes_count == 0:
-                try:
-                    os.remove(cache_filename)
-                except:
-                    pass
-            else:
+            if rows:
+                with open(cache_filename, 'wb') as f:
+                    f.write(("\n".join(rows) + "\n").encode('utf-8'))
                 self.log_history_event("", f"Error: {chunk.questionable_notes_count} questionable notes (task {chunk.id})")
         
         except Exception as ex:
@@ -1164,30 +1463,27 @@ class ACES:
         
         # Invalid Base Vehicles
         self.log_history_event("", "Looking for invalid basevehicles")
-        cache_filename = f"{chunk.cache_file}_invalidBasevehicles{chunk.id}.txt"
+        cache_filename = chunk.fragment_file("invalidBasevehicles")
         
         try:
-            with open(cache_filename, 'w', encoding='utf-8') as f:
-                for app in chunk.apps_list:
-                    if app.action == "D":
-                        continue
-                    
-                    if app.basevehicle_id not in vcdb.vcdb_basevehicle_dict:
-                        chunk.basevehicleids_errors_count += 1
-                        problem_data = (f"Invalid BaseVehicle ID\t{app.id}\t{app.basevehicle_id}\t"
-                                      f"Unknown\tUnknown\tUnknown\t"
-                                      f"{pcdb.nice_parttype(app.parttype_id)}\t"
-                                      f"{pcdb.nice_position(app.position_id)}\t"
-                                      f"{app.quantity}\t{app.part}\t"
-                                      f"{app.nice_full_fitment_string(vcdb, qdb)}")
-                        f.write(problem_data + "\n")
-            
-            if chunk.basevehicleids_errors_count == 0:
-                try:
-                    os.remove(cache_filename)
-                except:
-                    pass
-            else:
+            rows = []
+            for app in chunk.apps_list:
+                if app.action == "D":
+                    continue
+                
+                if app.basevehicle_id not in vcdb.vcdb_basevehicle_dict:
+                    chunk.basevehicleids_errors_count += 1
+                    problem_data = (f"Invalid BaseVehicle ID\t{app.id}\t{app.basevehicle_id}\t"
+                                  f"Unknown\tUnknown\tUnknown\t"
+                                  f"{pcdb.nice_parttype(app.parttype_id)}\t"
+                                  f"{pcdb.nice_position(app.position_id)}\t"
+                                  f"{app.quantity}\t{app.part}\t"
+                                  f"{app.nice_full_fitment_string(vcdb, qdb)}")
+                    rows.append(problem_data)
+            
+            if rows:
+                with open(cache_filename, 'wb') as f:
+                    f.write(("\n".join(rows) + "\n").encode('utf-8'))
                 self.log_history_event("", f"Error: {chunk.basevehicleids_errors_count} invalid basevehicle IDs (task {chunk.id})")
         
         except Exception as ex:
@@ -1195,35 +1491,32 @@ class ACES:
         
         # Invalid VCdb Codes
         self.log_history_event("", "Looking for invalid VCdb codes")
-        cache_filename = f"{chunk.cache_file}_invalidVCdbCodes{chunk.id}.txt"
+        cache_filename = chunk.fragment_file("invalidVCdbCodes")
         
         try:
-            with open(cache_filename, 'w', encoding='utf-8') as f:
-                for app in chunk.apps_list:
-                    if app.action == "D":
-                        continue
-                    
-                    for attribute in app.vcdb_attributes:
-                        if not vcdb.valid_attribute(attribute):
-                            chunk.vcdb_codes_errors_count += 1
-                            problem_data = (f"Invalid VCdb Code ({attribute.name}:{attribute.value})\t"
-                                          f"{app.id}\t{app.basevehicle_id}\t"
-                                          f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
-                                          f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
-                                          f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
-                                          f"{pcdb.nice_parttype(app.parttype_id)}\t"
-                                          f"{pcdb.nice_position(app.position_id)}\t"
-                                          f"{app.quantity}\t{app.part}\t"
-                                          f"{app.nice_attributes_string(vcdb, False)}\t"
-                                          f"{';'.join(app.notes)}")
-                            f.write(problem_data + "\n")
+            rows = []
+            for app in chunk.apps_list:
+                if app.action == "D":
+                    continue
+                
+                for attribute in app.vcdb_attributes:
+                    if not vcdb.valid_attribute(attribute):
+                        chunk.vcdb_codes_errors_count += 1
+                        problem_data = (f"Invalid VCdb Code ({attribute.name}:{attribute.value})\t"
+                                      f"{app.id}\t{app.basevehicle_id}\t"
+                                      f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
+                                      f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
+                                      f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
+                                      f"{pcdb.nice_parttype(app.parttype_id)}\t"
+                                      f"{pcdb.nice_position(app.position_id)}\t"
+                                      f"{app.quantity}\t{app.part}\t"
+                                      f"{app.nice_attributes_string(vcdb, False)}\t"
+                                      f"{';'.join(app.notes)}")
+                        rows.append(problem_data)
             
-            if chunk.vcdb_codes_errors_count == 0:
-                try:
-                    os.remove(cache_filename)
-                except:
-                    pass
-            else:
+            if rows:
+                with open(cache_filename, 'wb') as f:
+                    f.write(("\n".join(rows) + "\n").encode('utf-8'))
                 self.log_history_event("", f"Error: {chunk.vcdb_codes_errors_count} invalid VCdb codes (task {chunk.id})")
         
         except Exception as ex:
@@ -1231,33 +1524,30 @@ class ACES:
         
         # Configuration Errors
         self.log_history_event("", "Looking for configuration errors")
-        cache_filename = f"{chunk.cache_file}_configurationErrors{chunk.id}.txt"
+        cache_filename = chunk.fragment_file("configurationErrors")
         
         try:
-            with open(cache_filename, 'w', encoding='utf-8') as f:
-                for app in chunk.apps_list:
-                    if app.action == "D":
-                        continue
-                    
-                    if not vcdb.config_is_valid_memory_based(app):
-                        chunk.vcdb_configurations_errors_count += 1
-                        problem_data = (f"Invalid Configuration\t{app.id}\t{app.basevehicle_id}\t"
-                                      f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
-                                      f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
-                                      f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
-                                      f"{pcdb.nice_parttype(app.parttype_id)}\t"
-                                      f"{pcdb.nice_position(app.position_id)}\t"
-                                      f"{app.quantity}\t{app.part}\t"
-                                      f"{app.nice_attributes_string(vcdb, False)}\t"
-                                      f"{';'.join(app.notes)}")
-                        f.write(problem_data + "\n")
-            
-            if chunk.vcdb_configurations_errors_count == 0:
-                try:
-                    os.remove(cache_filename)
-                except:
-                    pass
-            else:
+            rows = []
+            for app in chunk.apps_list:
+                if app.action == "D":
+                    continue
+                
+                if not vcdb.config_is_valid_memory_based(app):
+                    chunk.vcdb_configurations_errors_count += 1
+                    problem_data = (f"Invalid Configuration\t{app.id}\t{app.basevehicle_id}\t"
+                                  f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
+                                  f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
+                                  f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
+                                  f"{pcdb.nice_parttype(app.parttype_id)}\t"
+                                  f"{pcdb.nice_position(app.position_id)}\t"
+                                  f"{app.quantity}\t{app.part}\t"
+                                  f"{app.nice_attributes_string(vcdb, False)}\t"
+                                  f"{';'.join(app.notes)}")
+                    rows.append(problem_data)
+            
+            if rows:
+                with open(cache_filename, 'wb') as f:
+                    f.write(("\n".join(rows) + "\n").encode('utf-8'))
                 self.log_history_event("", f"Error: {chunk.vcdb_configurations_errors_count} invalid configurations (task {chunk.id})")
         
         except Exception as ex:
@@ -1268,7 +1558,7 @@ class ACES:
         
         # Quantity outliers
         self.log_history_event("", "Looking for quantity outliers")
-        cache_filename = f"{chunk.cache_file}_qtyOutliers.txt"
+        cache_filename = chunk.fragment_file("qtyOutliers", numbered=False)
         
         try:
             # Group apps by part type and position to analyze quantities
@@ -1279,48 +1569,45 @@ class ACES:
                 key = f"{app.parttype_id}_{app.position_id}"
                 part_qty_groups[key].append(app)
             
-            with open(cache_filename, 'w', encoding='utf-8') as f:
-                for group_key, apps in part_qty_groups.items():
-                    if len(apps) < self.qty_outlier_sample_size:
-                        continue
-                    
-                    quantities = [app.quantity for app in apps]
-                    if not quantities:
-                        continue
-                    
-                    # Calculate statistical outliers (simple implementation)
-                    quantities.sort()
-                    q1_index = len(quantities) // 4
-                    q3_index = 3 * len(quantities) // 4
+            rows = []
+            for group_key, apps in part_qty_groups.items():
+                if len(apps) < self.qty_outlier_sample_size:
+                    continue
+                
+                quantities = [app.quantity for app in apps]
+                if not quantities:
+                    continue
+                
+                # Calculate statistical outliers (simple implementation)
+                quantities.sort()
+                q1_index = len(quantities) // 4
+                q3_index = 3 * len(quantities) // 4
+                
+                if q1_index < len(quantities) and q3_index < len(quantities):
+                    q1 = quantities[q1_index]
+                    q3 = quantities[q3_index]
+                    iqr = q3 - q1
                     
-                    if q1_index < len(quantities) and q3_index < len(quantities):
-                        q1 = quantities[q1_index]
-                        q3 = quantities[q3_index]
-                        iqr = q3 - q1
+                    if iqr > 0:
+                        lower_bound = q1 - 1.5 * iqr
+                        upper_bound = q3 + 1.5 * iqr
                         
-                        if iqr > 0:
-                            lower_bound = q1 - 1.5 * iqr
-                            upper_bound = q3 + 1.5 * iqr
-                            
-                            for app in apps:
-                                if app.quantity < lower_bound or app.quantity > upper_bound:
-                                    chunk.qty_outlier_count += 1
-                                    problem_data = (f"Quantity outlier ({app.quantity})\t{app.id}\t{app.basevehicle_id}\t"
-                                                  f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
-                                                  f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
-                                                  f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
-                                                  f"{pcdb.nice_parttype(app.parttype_id)}\t"
-                                                  f"{pcdb.nice_position(app.position_id)}\t"
-                                                  f"{app.quantity}\t{app.part}\t"
-                                                  f"{app.nice_full_fitment_string(vcdb, qdb)}")
-                                    f.write(problem_data + "\n")
+                        for app in apps:
+                            if app.quantity < lower_bound or app.quantity > upper_bound:
+                                chunk.qty_outlier_count += 1
+                                problem_data = (f"Quantity outlier ({app.quantity})\t{app.id}\t{app.basevehicle_id}\t"
+                                              f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
+                                              f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
+                                              f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
+                                              f"{pcdb.nice_parttype(app.parttype_id)}\t"
+                                              f"{pcdb.nice_position(app.position_id)}\t"
+                                              f"{app.quantity}\t{app.part}\t"
+                                              f"{app.nice_full_fitment_string(vcdb, qdb)}")
+                                rows.append(problem_data)
             
-            if chunk.qty_outlier_count == 0:
-                try:
-                    os.remove(cache_filename)
-                except:
-                    pass
-            else:
+            if rows:
+                with open(cache_filename, 'wb') as f:
+                    f.write(("\n".join(rows) + "\n").encode('utf-8'))
                 self.log_history_event("", f"Warning: {chunk.qty_outlier_count} quantity outliers")
         
         except Exception as ex:
@@ -1328,7 +1615,7 @@ class ACES:
         
         # Part type disagreements
         self.log_history_event("", "Looking for part type disagreements")
-        cache_filename = f"{chunk.cache_file}_parttypeDisagreements.txt"
+        cache_filename = chunk.fragment_file("parttypeDisagreements", numbered=False)
         
         try:
             # Group by part number and check for different part types
@@ -1338,29 +1625,26 @@ class ACES:
                     continue
                 part_groups[app.part].add(app.parttype_id)
             
-            with open(cache_filename, 'w', encoding='utf-8') as f:
-                for part, parttype_ids in part_groups.items():
-                    if len(parttype_ids) > 1:
-                        # This part appears with multiple part types
-                        for app in chunk.apps_list:
-                            if app.part == part and app.action != "D":
-                                chunk.parttype_disagreement_errors_count += 1
-                                problem_data = (f"Part type disagreement\t{app.id}\t{app.basevehicle_id}\t"
-                                              f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
-                                              f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
-                                              f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
-                                              f"{pcdb.nice_parttype(app.parttype_id)}\t"
-                                              f"{pcdb.nice_position(app.position_id)}\t"
-                                              f"{app.quantity}\t{app.part}\t"
-                                              f"{app.nice_full_fitment_string(vcdb, qdb)}")
-                                f.write(problem_data + "\n")
+            rows = []
+            for part, parttype_ids in part_groups.items():
+                if len(parttype_ids) > 1:
+                    # This part appears with multiple part types
+                    for app in chunk.apps_list:
+                        if app.part == part and app.action != "D":
+                            chunk.parttype_disagreement_errors_count += 1
+                            problem_data = (f"Part type disagreement\t{app.id}\t{app.basevehicle_id}\t"
+                                          f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
+                                          f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
+                                          f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
+                                          f"{pcdb.nice_parttype(app.parttype_id)}\t"
+                                          f"{pcdb.nice_position(app.position_id)}\t"
+                                          f"{app.quantity}\t{app.part}\t"
+                                          f"{app.nice_full_fitment_string(vcdb, qdb)}")
+                            rows.append(problem_data)
             
-            if chunk.parttype_disagreement_errors_count == 0:
-                try:
-                    os.remove(cache_filename)
-                except:
-                    pass
-            else:
+            if rows:
+                with open(cache_filename, 'wb') as f:
+                    f.write(("\n".join(rows) + "\n").encode('utf-8'))
                 self.log_history_event("", f"Warning: {chunk.parttype_disagreement_errors_count} part type disagreements")
         
         except Exception as ex:
@@ -1368,33 +1652,30 @@ class ACES:
         
         # Asset problems
         self.log_history_event("", "Looking for asset problems")
-        cache_filename = f"{chunk.cache_file}_assetProblems.txt"
+        cache_filename = chunk.fragment_file("assetProblems", numbered=False)
         
         try:
-            with open(cache_filename, 'w', encoding='utf-8') as f:
-                for app in chunk.apps_list:
-                    if app.action == "D":
-                        continue
-                    
-                    # Check for asset-related issues
-                    if app.asset and not app.asset.strip():
-                        chunk.asset_problems_count += 1
-                        problem_data = (f"Empty asset name\t{app.id}\t{app.basevehicle_id}\t"
-                                      f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
-                                      f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
-                                      f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
-                                      f"{pcdb.nice_parttype(app.parttype_id)}\t"
-                                      f"{pcdb.nice_position(app.position_id)}\t"
-                                      f"{app.quantity}\t{app.part}\t"
-                                      f"{app.nice_full_fitment_string(vcdb, qdb)}")
-                        f.write(problem_data + "\n")
-            
-            if chunk.asset_problems_count == 0:
-                try:
-                    os.remove(cache_filename)
-                except:
-                    pass
-            else:
+            rows = []
+            for app in chunk.apps_list:
+                if app.action == "D":
+                    continue
+                
+                # Check for asset-related issues
+                if app.asset and not app.asset.strip():
+                    chunk.asset_problems_count += 1
+                    problem_data = (f"Empty asset name\t{app.id}\t{app.basevehicle_id}\t"
+                                  f"{vcdb.nice_make_of_basevid(app.basevehicle_id)}\t"
+                                  f"{vcdb.nice_model_of_basevid(app.basevehicle_id)}\t"
+                                  f"{vcdb.nice_year_of_basevid(app.basevehicle_id)}\t"
+                                  f"{pcdb.nice_parttype(app.parttype_id)}\t"
+                                  f"{pcdb.nice_position(app.position_id)}\t"
+                                  f"{app.quantity}\t{app.part}\t"
+                                  f"{app.nice_full_fitment_string(vcdb, qdb)}")
+                    rows.append(problem_data)
+            
+            if rows:
+                with open(cache_filename, 'wb') as f:
+                    f.write(("\n".join(rows) + "\n").encode('utf-8'))
                 self.log_history_event("", f"Warning: {chunk.asset_problems_count} asset problems")
         
         except Exception as ex:
@@ -1428,8 +1709,8 @@ class ACES:
                 for fitment_key, apps in fitment_groups.items():
                     if len(apps) > 1:
                         # Multiple apps with same fitment - potential overlap
-                        unique_parts = set(app.part for app in apps)
-                        if len(unique_parts) > 1:
+                        first_part = apps[0].part
+                        if any(app.part != first_part for app in apps):
                             # Different parts with same fitment - this is a logic problem
                             chunk.problem_apps_list.extend(apps)
                             chunk.lowest_badness_permutation = ["Fitment_Overlap"]
@@ -1505,22 +1786,19 @@ class ACES:
         """Export applications as ACES XML"""
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
-                f.write(f'<ACES version="{self.version}">\n')
-                
-                # Write header
-                f.write('  <Header>\n')
-                f.write(f'    <Company>{self.company}</Company>\n')
-                f.write(f'    <SenderName>{self.sender_name}</SenderName>\n')
-                f.write(f'    <SenderPhone>{self.sender_phone}</SenderPhone>\n')
-                f.write(f'    <TransferDate>{self.transfer_date}</TransferDate>\n')
-                f.write(f'    <DocumentTitle>{self.document_title}</DocumentTitle>\n')
-                f.write(f'    <EffectiveDate>{self.effective_date}</EffectiveDate>\n')
-                f.write(f'    <SubmissionType>{submission_type}</SubmissionType>\n')
-                f.write(f'    <VcdbVersionDate>{self.vcdb_version_date}</VcdbVersionDate>\n')
-                f.write(f'    <QdbVersionDate>{self.qdb_version_date}</QdbVersionDate>\n')
-                f.write(f'    <PcdbVersionDate>{self.pcdb_version_date}</PcdbVersionDate>\n')
-                f.write('  </Header>\n')
+                f.write(_EXPORT_HEADER_TMPL.format_map({
+                    'version': self.version,
+                    'company': self.company,
+                    'sender_name': self.sender_name,
+                    'sender_phone': self.sender_phone,
+                    'transfer_date': self.transfer_date,
+                    'document_title': self.document_title,
+                    'effective_date': self.effective_date,
+                    'submission_type': submission_type,
+                    'vcdb_version_date': self.vcdb_version_date,
+                    'qdb_version_date': self.qdb_version_date,
+                    'pcdb_version_date': self.pcdb_version_date,
+                }))
                 
                 # Write applications
                 for app in self.apps:
@@ -1531,93 +1809,68 @@ class ACES:
                     self._write_asset_xml(f, asset)
                 
                 # Write footer
-                f.write('  <Footer>\n')
-                f.write(f'    <RecordCount>{len(self.apps)}</RecordCount>\n')
-                f.write('  </Footer>\n')
-                f.write('</ACES>\n')
+                f.write(_EXPORT_FOOTER_TMPL % len(self.apps))
             
             return ""
         except Exception as ex:
             return str(ex)
     
+    def _fitment_xml_parts(self, parts: List[str], item):
+        """Append the BaseVehicle, VCdb attribute, Qdb qualifier and note elements of an app or asset"""
+        if item.basevehicle_id:
+            parts.append(f'    <BaseVehicle id="{item.basevehicle_id}"></BaseVehicle>\n')
+        
+        for attr in item.vcdb_attributes:
+            parts.append(f'    <{attr.name} id="{attr.value}"></{attr.name}>\n')
+        
+        for qual in item.qdb_qualifiers:
+            parts.append(f'    <Qual id="{qual.qualifier_id}">\n')
+            for param in qual.qualifier_parameters:
+                parts.append(f'      <param value="{param}"></param>\n')
+            parts.append('      <text></text>\n    </Qual>\n')
+        
+        for note in item.notes:
+            parts.append(f'    <Note>{note}</Note>\n')
+    
     def _write_app_xml(self, f, app: App):
         """Write application XML"""
-        f.write(f'  <App action="{app.action}" id="{app.id}"')
+        parts = [f'  <App action="{app.action}" id="{app.id}"']
         if app.reference:
-            f.write(f' ref="{app.reference}"')
+            parts.append(f' ref="{app.reference}"')
         if not app.validate:
-            f.write(' validate="no"')
-        f.write('>\n')
-        
-        # Write base vehicle
-        if app.basevehicle_id:
-            f.write(f'    <BaseVehicle id="{app.basevehicle_id}"></BaseVehicle>\n')
-        
-        # Write VCdb attributes
-        for attr in app.vcdb_attributes:
-            f.write(f'    <{attr.name} id="{attr.value}"></{attr.name}>\n')
-        
-        # Write Qdb qualifiers
-        for qual in app.qdb_qualifiers:
-            f.write(f'    <Qual id="{qual.qualifier_id}">\n')
-            for param in qual.qualifier_parameters:
-                f.write(f'      <param value="{param}"></param>\n')
-            f.write('      <text></text>\n')
-            f.write('    </Qual>\n')
+            parts.append(' validate="no"')
+        parts.append('>\n')
         
-        # Write notes
-        for note in app.notes:
-            f.write(f'    <Note>{note}</Note>\n')
+        self._fitment_xml_parts(parts, app)
         
         # Write part information
-        f.write(f'    <Qty>{app.quantity}</Qty>\n')
-        f.write(f'    <PartType id="{app.parttype_id}"></PartType>\n')
+        parts.append(f'    <Qty>{app.quantity}</Qty>\n')
+        parts.append(f'    <PartType id="{app.parttype_id}"></PartType>\n')
         if app.mfr_label:
-            f.write(f'    <MfrLabel>{app.mfr_label}</MfrLabel>\n')
+            parts.append(f'    <MfrLabel>{app.mfr_label}</MfrLabel>\n')
         if app.position_id:
-            f.write(f'    <Position id="{app.position_id}"></Position>\n')
-        f.write(f'    <Part')
+            parts.append(f'    <Position id="{app.position_id}"></Position>\n')
         if app.brand:
-            f.write(f' BrandAAIAID="{app.brand}"')
-        f.write(f'>{app.part}</Part>\n')
+            parts.append(f'    <Part BrandAAIAID="{app.brand}">{app.part}</Part>\n')
+        else:
+            parts.append(f'    <Part>{app.part}</Part>\n')
         
         if app.asset:
-            f.write(f'    <AssetName>{app.asset}</AssetName>\n')
+            parts.append(f'    <AssetName>{app.asset}</AssetName>\n')
             if app.asset_item_order:
-                f.write(f'    <AssetItemOrder>{app.asset_item_order}</AssetItemOrder>\n')
+                parts.append(f'    <AssetItemOrder>{app.asset_item_order}</AssetItemOrder>\n')
             if app.asset_item_ref:
-                f.write(f'    <AssetItemRef>{app.asset_item_ref}</AssetItemRef>\n')
+                parts.append(f'    <AssetItemRef>{app.asset_item_ref}</AssetItemRef>\n')
         
-        f.write('  </App>\n')
+        parts.append('  </App>\n')
+        f.write(''.join(parts))
     
     def _write_asset_xml(self, f, asset: Asset):
         """Write asset XML"""
-        f.write(f'  <Asset action="{asset.action}" id="{asset.id}">\n')
-        
-        # Write base vehicle
-        if asset.basevehicle_id:
-            f.write(f'    <BaseVehicle id="{asset.basevehicle_id}"></BaseVehicle>\n')
-        
-        # Write VCdb attributes
-        for attr in asset.vcdb_attributes:
-            f.write(f'    <{attr.name} id="{attr.value}"></{attr.name}>\n')
-        
-        # Write Qdb qualifiers
-        for qual in asset.qdb_qualifiers:
-            f.write(f'    <Qual id="{qual.qualifier_id}">\n')
-            for param in qual.qualifier_parameters:
-                f.write(f'      <param value="{param}"></param>\n')
-            f.write('      <text></text>\n')
-            f.write('    </Qual>\n')
-        
-        # Write notes
-        for note in asset.notes:
-            f.write(f'    <Note>{note}</Note>\n')
-        
-        # Write asset name
-        f.write(f'    <AssetName>{asset.asset_name}</AssetName>\n')
-        
-        f.write('  </Asset>\n')
+        parts = [f'  <Asset action="{asset.action}" id="{asset.id}">\n']
+        self._fitment_xml_parts(parts, asset)
+        parts.append(f'    <AssetName>{asset.asset_name}</AssetName>\n  </Asset>\n')
+        f.write(''.join(parts))
     
     def generate_assessment_file(self, file_path: str, vcdb: 'VCdb', pcdb: 'PCdb', qdb: 'Qdb',
                                 all_coverage: float, modern_coverage: float,
@@ -1626,75 +1879,14 @@ class ACES:
                                 start_time: datetime, cache_path: str):
         """Generate comprehensive assessment file in Excel XML format"""
         
-        def escape_xml(text):
-            """Escape XML special characters"""
-            if not text:
-                return ""
-            return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("'", "&apos;").replace('"', "&quot;")
-        
         runtime = datetime.now() - start_time
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                # Write Excel XML header
-                f.write('<?xml version="1.0"?>'
-                       '<?mso-application progid="Excel.Sheet"?>'
-                       '<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet" '
-                       'xmlns:o="urn:schemas-microsoft-com:office:office" '
-                       'xmlns:x="urn:schemas-microsoft-com:office:excel" '
-                       'xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet" '
-                       'xmlns:html="http://www.w3.org/TR/REC-html40">')
-                
-                # Document properties
-                f.write('<DocumentProperties xmlns="urn:schemas-microsoft-com:office:office">'
-                       '<Author>ACESinspector</Author>'
-                       '<LastAuthor>ACESinspector</LastAuthor>'
-                       f'<Created>{datetime.now().isoformat()}Z</Created>'
-                       '<Version>14.00</Version>'
-                       '</DocumentProperties>')
-                
-                # Styles
-                f.write('<Styles>'
-                       '<Style ss:ID="Default" ss:Name="Normal">'
-                       '<Alignment ss:Vertical="Bottom"/>'
-                       '<Borders/>'
-                       '<Font ss:FontName="Calibri" x:Family="Swiss" ss:Size="11" ss:Color="#000000"/>'
-                       '<Interior/>'
-                       '<NumberFormat/>'
-                       '<Protection/>'
-                       '</Style>'
-                       '<Style ss:ID="s62"><NumberFormat ss:Format="Short Date"/></Style>'
-                       '<Style ss:ID="s64" ss:Name="Hyperlink">'
-                       '<Font ss:FontName="Calibri" x:Family="Swiss" ss:Size="11" ss:Color="#0000FF" ss:Underline="Single"/>'
-                       '</Style>'
-                       '<Style ss:ID="s65">'
-                       '<Font ss:FontName="Calibri" x:Family="Swiss" ss:Size="11" ss:Color="#000000" ss:Bold="1"/>'
-                       '<Interior ss:Color="#D9D9D9" ss:Pattern="Solid"/>'
-                       '</Style>'
-                       '</Styles>')
+            with open(file_path, 'wb', buffering=_ASSESSMENT_WRITE_BUFFER_SIZE) as f:
+                # Workbook header, document properties and styles
+                f.write(_ASSESSMENT_PREAMBLE_TMPL % datetime.now().isoformat().encode('ascii'))
                 
                 # Stats worksheet
-                f.write('<Worksheet ss:Name="Stats">'
-                       '<Table ss:ExpandedColumnCount="3" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                       '<Column ss:Width="170"/>'
-                       '<Column ss:Width="171"/>'
-                       '<Column ss:Width="144"/>')
-                
-                # Stats content
-                f.write(f'<Row><Cell><Data ss:Type="String">Input Filename</Data></Cell>'
-                       f'<Cell><Data ss:Type="String">{escape_xml(os.path.basename(self.file_path))}</Data></Cell></Row>')
-                f.write(f'<Row><Cell><Data ss:Type="String">Title</Data></Cell>'
-                       f'<Cell><Data ss:Type="String">{escape_xml(self.document_title)}</Data></Cell></Row>')
-                f.write(f'<Row><Cell><Data ss:Type="String">Brand</Data></Cell>'
-                       f'<Cell><Data ss:Type="String">{escape_xml(self.brand_aaiaid)}</Data></Cell></Row>')
-                f.write(f'<Row><Cell><Data ss:Type="String">ACES version</Data></Cell>'
-                       f'<Cell><Data ss:Type="String">{escape_xml(self.version)}</Data></Cell></Row>')
-                f.write(f'<Row><Cell><Data ss:Type="String">Application count</Data></Cell>'
-                       f'<Cell><Data ss:Type="Number">{len(self.apps)}</Data></Cell></Row>')
-                f.write(f'<Row><Cell><Data ss:Type="String">Unique Part count</Data></Cell>'
-                       f'<Cell><Data ss:Type="Number">{len(self.parts_app_counts)}</Data></Cell></Row>')
-                
-                # Result
                 total_errors = (self.basevehicleids_errors_count + self.vcdb_codes_errors_count + 
                                self.vcdb_configurations_errors_count + self.qdb_errors_count + 
                                self.parttype_position_errors_count)
@@ -1714,33 +1906,37 @@ class ACES:
                     if self.fitment_logic_problems_count > 0:
                         failure_reasons.append(f"{self.fitment_logic_problems_count} fitment logic problems")
                     
-                    f.write(f'<Row><Cell><Data ss:Type="String">Result</Data></Cell>'
-                           f'<Cell><Data ss:Type="String">Fail</Data></Cell>'
-                           f'<Cell><Data ss:Type="String">{escape_xml(", ".join(failure_reasons))}</Data></Cell></Row>')
+                    result_row = _STATS_RESULT_FAIL_TMPL.substitute(
+                        failure_reasons=_escape_xml(", ".join(failure_reasons)))
                 else:
-                    f.write('<Row><Cell><Data ss:Type="String">Result</Data></Cell>'
-                           '<Cell><Data ss:Type="String">Pass</Data></Cell></Row>')
+                    result_row = _STATS_RESULT_PASS
                 
-                f.write(f'<Row><Cell><Data ss:Type="String">All BaseVehicle Coverage (%)</Data></Cell>'
-                       f'<Cell><Data ss:Type="Number">{all_coverage:.2f}</Data></Cell>'
-                       f'<Cell><Data ss:Type="String">{basevehicle_hit_count} used, {total_basevehicles} available</Data></Cell></Row>')
-                f.write(f'<Row><Cell><Data ss:Type="String">1990+ BaseVehicle Coverage (%)</Data></Cell>'
-                       f'<Cell><Data ss:Type="Number">{modern_coverage:.2f}</Data></Cell>'
-                       f'<Cell><Data ss:Type="String">{modern_basevehicle_hit_count} used, {modern_basevehicles_available} available</Data></Cell></Row>')
-                f.write(f'<Row><Cell><Data ss:Type="String">Processing Time (Seconds)</Data></Cell>'
-                       f'<Cell><Data ss:Type="Number">{runtime.total_seconds():.1f}</Data></Cell></Row>')
-                
-                f.write('</Table></Worksheet>')
+                f.write(_STATS_TMPL.substitute(
+                    input_filename=_escape_xml(os.path.basename(self.file_path)),
+                    title=_escape_xml(self.document_title),
+                    brand=_escape_xml(self.brand_aaiaid),
+                    version=_escape_xml(self.version),
+                    app_count=len(self.apps),
+                    part_count=len(self.parts_app_counts),
+                    result_row=result_row,
+                    all_coverage=f"{all_coverage:.2f}",
+                    basevehicle_hit_count=basevehicle_hit_count,
+                    total_basevehicles=total_basevehicles,
+                    modern_coverage=f"{modern_coverage:.2f}",
+                    modern_basevehicle_hit_count=modern_basevehicle_hit_count,
+                    modern_basevehicles_available=modern_basevehicles_available,
+                    runtime=f"{runtime.total_seconds():.1f}",
+                ).encode('utf-8'))
                 
                 # Parts worksheet
-                f.write('<Worksheet ss:Name="Parts">'
-                       '<Table ss:ExpandedColumnCount="4" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                       '<Row>'
-                       '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                       '<Cell ss:StyleID="s65"><Data ss:Type="String">Applications Count</Data></Cell>'
-                       '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Types</Data></Cell>'
-                       '<Cell ss:StyleID="s65"><Data ss:Type="String">Positions</Data></Cell>'
-                       '</Row>')
+                parts = ['<Worksheet ss:Name="Parts">'
+                         '<Table ss:ExpandedColumnCount="4" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
+                         '<Row>'
+                         '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
+                         '<Cell ss:StyleID="s65"><Data ss:Type="String">Applications Count</Data></Cell>'
+                         '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Types</Data></Cell>'
+                         '<Cell ss:StyleID="s65"><Data ss:Type="String">Positions</Data></Cell>'
+                         '</Row>']
                 
                 for part, count in self.parts_app_counts.items():
                     part_types = []
@@ -1751,388 +1947,62 @@ class ACES:
                     if part in self.parts_positions:
                         positions = [pcdb.nice_position(pos_id) for pos_id in self.parts_positions[part]]
                     
-                    f.write(f'<Row>'
-                           f'<Cell><Data ss:Type="String">{escape_xml(part)}</Data></Cell>'
-                           f'<Cell><Data ss:Type="Number">{count}</Data></Cell>'
-                           f'<Cell><Data ss:Type="String">{escape_xml(",".join(part_types))}</Data></Cell>'
-                           f'<Cell><Data ss:Type="String">{escape_xml(",".join(positions))}</Data></Cell>'
-                           f'</Row>')
+                    parts.append(f'<Row>'
+                                 f'<Cell><Data ss:Type="String">{_escape_xml(part)}</Data></Cell>'
+                                 f'<Cell><Data ss:Type="Number">{count}</Data></Cell>'
+                                 f'<Cell><Data ss:Type="String">{_escape_xml(",".join(part_types))}</Data></Cell>'
+                                 f'<Cell><Data ss:Type="String">{_escape_xml(",".join(positions))}</Data></Cell>'
+                                 f'</Row>')
                 
-                f.write('</Table></Worksheet>')
+                parts.append('</Table></Worksheet>')
+                f.write(''.join(parts).encode('utf-8'))
                 
                 # Error worksheets - add individual error worksheets based on analysis results
-                self._write_error_worksheets(f, vcdb, pcdb, qdb, cache_path, escape_xml)
+                self._write_error_worksheets(f, vcdb, pcdb, qdb, cache_path)
                 
-                f.write('</Workbook>')
+                f.write(b'</Workbook>')
                 
         except Exception as ex:
             self.log_history_event("", f"Error generating assessment file: {ex}")
             raise
     
-    def _write_error_worksheets(self, f, vcdb: 'VCdb', pcdb: 'PCdb', qdb: 'Qdb', cache_path: str, escape_xml):
+    def _write_error_worksheets(self, f, vcdb: 'VCdb', pcdb: 'PCdb', qdb: 'Qdb', cache_path: str):
         """Write error worksheets to assessment file"""
         
-        # Part Type Position Errors
-        if self.parttype_position_errors_count > 0:
-            f.write('<Worksheet ss:Name="PartType-Position Errors">'
-                   '<Table ss:ExpandedColumnCount="11" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                   '<Row>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Error</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">App Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Base Vehicle Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Make</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Model</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Year</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Type</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Position</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Quantity</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Fitment</Data></Cell>'
-                   '</Row>')
-            
-            # Read error files and write data
-            for chunk in self.individual_analysis_chunks_list:
-                if chunk.parttype_position_errors_count > 0:
-                    try:
-                        error_file = f"{chunk.cache_file}_parttypePositionErrors{chunk.id}.txt"
-                        if os.path.exists(error_file):
-                            with open(error_file, 'r', encoding='utf-8') as ef:
-                                for line in ef:
-                                    fields = line.strip().split('\t')
-                                    if len(fields) >= 11:
-                                        f.write('<Row>')
-                                        for field in fields[:11]:
-                                            f.write(f'<Cell><Data ss:Type="String">{escape_xml(field)}</Data></Cell>')
-                                        f.write('</Row>')
-                    except:
-                        pass
-            
-            f.write('</Table></Worksheet>')
-        
-        # Qdb Errors
-        if self.qdb_errors_count > 0:
-            f.write('<Worksheet ss:Name="Qdb Errors">'
-                   '<Table ss:ExpandedColumnCount="12" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                   '<Row>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Error</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">App Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Base Vehicle Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Make</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Model</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Year</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Type</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Position</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Quantity</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Attributes</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Notes</Data></Cell>'
-                   '</Row>')
-            
-            for chunk in self.individual_analysis_chunks_list:
-                if chunk.qdb_errors_count > 0:
-                    try:
-                        error_file = f"{chunk.cache_file}_QdbErrors{chunk.id}.txt"
-                        if os.path.exists(error_file):
-                            with open(error_file, 'r', encoding='utf-8') as ef:
-                                for line in ef:
-                                    fields = line.strip().split('\t')
-                                    if len(fields) >= 12:
-                                        f.write('<Row>')
-                                        for field in fields[:12]:
-                                            f.write(f'<Cell><Data ss:Type="String">{escape_xml(field)}</Data></Cell>')
-                                        f.write('</Row>')
-                    except:
-                        pass
-            
-            f.write('</Table></Worksheet>')
-        
-        # Questionable Notes
-        if self.questionable_notes_count > 0:
-            f.write('<Worksheet ss:Name="Questionable Notes">'
-                   '<Table ss:ExpandedColumnCount="12" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                   '<Row>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Error</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">App Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Base Vehicle Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Make</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Model</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Year</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Type</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Position</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Quantity</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Attributes</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Notes</Data></Cell>'
-                   '</Row>')
-            
-            for chunk in self.individual_analysis_chunks_list:
-                if chunk.questionable_notes_count > 0:
-                    try:
-                        error_file = f"{chunk.cache_file}_questionableNotes{chunk.id}.txt"
-                        if os.path.exists(error_file):
-                            with open(error_file, 'r', encoding='utf-8') as ef:
-                                for line in ef:
-                                    fields = line.strip().split('\t')
-                                    if len(fields) >= 12:
-                                        f.write('<Row>')
-                                        for field in fields[:12]:
-                                            f.write(f'<Cell><Data ss:Type="String">{escape_xml(field)}</Data></Cell>')
-                                        f.write('</Row>')
-                    except:
-                        pass
-            
-            f.write('</Table></Worksheet>')
-        
-        # Invalid BaseVehicles
-        if self.basevehicleids_errors_count > 0:
-            f.write('<Worksheet ss:Name="Invalid BaseVehicles">'
-                   '<Table ss:ExpandedColumnCount="11" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                   '<Row>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Error</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">App Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Base Vehicle Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Make</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Model</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Year</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Type</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Position</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Quantity</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Fitment</Data></Cell>'
-                   '</Row>')
-            
-            for chunk in self.individual_analysis_chunks_list:
-                if chunk.basevehicleids_errors_count > 0:
-                    try:
-                        error_file = f"{chunk.cache_file}_invalidBasevehicles{chunk.id}.txt"
-                        if os.path.exists(error_file):
-                            with open(error_file, 'r', encoding='utf-8') as ef:
-                                for line in ef:
-                                    fields = line.strip().split('\t')
-                                    if len(fields) >= 11:
-                                        f.write('<Row>')
-                                        for field in fields[:11]:
-                                            f.write(f'<Cell><Data ss:Type="String">{escape_xml(field)}</Data></Cell>')
-                                        f.write('</Row>')
-                    except:
-                        pass
-            
-            f.write('</Table></Worksheet>')
-        
-        # Invalid VCdb Codes
-        if self.vcdb_codes_errors_count > 0:
-            f.write('<Worksheet ss:Name="Invalid VCdb Codes">'
-                   '<Table ss:ExpandedColumnCount="12" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                   '<Row>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Error</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">App Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Base Vehicle Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Make</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Model</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Year</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Type</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Position</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Quantity</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Attributes</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Notes</Data></Cell>'
-                   '</Row>')
-            
-            for chunk in self.individual_analysis_chunks_list:
-                if chunk.vcdb_codes_errors_count > 0:
-                    try:
-                        error_file = f"{chunk.cache_file}_invalidVCdbCodes{chunk.id}.txt"
-                        if os.path.exists(error_file):
-                            with open(error_file, 'r', encoding='utf-8') as ef:
-                                for line in ef:
-                                    fields = line.strip().split('\t')
-                                    if len(fields) >= 12:
-                                        f.write('<Row>')
-                                        for field in fields[:12]:
-                                            f.write(f'<Cell><Data ss:Type="String">{escape_xml(field)}</Data></Cell>')
-                                        f.write('</Row>')
-                    except:
-                        pass
-            
-            f.write('</Table></Worksheet>')
-        
-        # Configuration Errors
-        if self.vcdb_configurations_errors_count > 0:
-            f.write('<Worksheet ss:Name="Configuration Errors">'
-                   '<Table ss:ExpandedColumnCount="12" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                   '<Row>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Error</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">App Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Base Vehicle Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Make</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Model</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Year</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Type</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Position</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Quantity</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Attributes</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Notes</Data></Cell>'
-                   '</Row>')
-            
-            for chunk in self.individual_analysis_chunks_list:
-                if chunk.vcdb_configurations_errors_count > 0:
-                    try:
-                        error_file = f"{chunk.cache_file}_configurationErrors{chunk.id}.txt"
-                        if os.path.exists(error_file):
-                            with open(error_file, 'r', encoding='utf-8') as ef:
-                                for line in ef:
-                                    fields = line.strip().split('\t')
-                                    if len(fields) >= 12:
-                                        f.write('<Row>')
-                                        for field in fields[:12]:
-                                            f.write(f'<Cell><Data ss:Type="String">{escape_xml(field)}</Data></Cell>')
-                                        f.write('</Row>')
-                    except:
-                        pass
-            
-            f.write('</Table></Worksheet>')
-        
-        # Quantity Outliers
-        if self.qty_outlier_count > 0:
-            f.write('<Worksheet ss:Name="Quantity Outliers">'
-                   '<Table ss:ExpandedColumnCount="11" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                   '<Row>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Warning</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">App Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Base Vehicle Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Make</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Model</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Year</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Type</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Position</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Quantity</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Fitment</Data></Cell>'
-                   '</Row>')
-            
-            for chunk in self.outlier_analysis_chunks_list:
-                if chunk.qty_outlier_count > 0:
-                    try:
-                        error_file = f"{chunk.cache_file}_qtyOutliers.txt"
-                        if os.path.exists(error_file):
-                            with open(error_file, 'r', encoding='utf-8') as ef:
-                                for line in ef:
-                                    fields = line.strip().split('\t')
-                                    if len(fields) >= 11:
-                                        f.write('<Row>')
-                                        for field in fields[:11]:
-                                            f.write(f'<Cell><Data ss:Type="String">{escape_xml(field)}</Data></Cell>')
-                                        f.write('</Row>')
-                    except:
-                        pass
-            
-            f.write('</Table></Worksheet>')
-        
-        # Part Type Disagreements
-        if self.parttype_disagreement_count > 0:
-            f.write('<Worksheet ss:Name="Part Type Disagreements">'
-                   '<Table ss:ExpandedColumnCount="11" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                   '<Row>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Warning</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">App Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Base Vehicle Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Make</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Model</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Year</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Type</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Position</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Quantity</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Fitment</Data></Cell>'
-                   '</Row>')
-            
-            for chunk in self.outlier_analysis_chunks_list:
-                if chunk.parttype_disagreement_errors_count > 0:
-                    try:
-                        error_file = f"{chunk.cache_file}_parttypeDisagreements.txt"
-                        if os.path.exists(error_file):
-                            with open(error_file, 'r', encoding='utf-8') as ef:
-                                for line in ef:
-                                    fields = line.strip().split('\t')
-                                    if len(fields) >= 11:
-                                        f.write('<Row>')
-                                        for field in fields[:11]:
-                                            f.write(f'<Cell><Data ss:Type="String">{escape_xml(field)}</Data></Cell>')
-                                        f.write('</Row>')
-                    except:
-                        pass
-            
-            f.write('</Table></Worksheet>')
-        
-        # Asset Problems
-        if self.asset_problems_count > 0:
-            f.write('<Worksheet ss:Name="Asset Problems">'
-                   '<Table ss:ExpandedColumnCount="11" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                   '<Row>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Warning</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">App Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Base Vehicle Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Make</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Model</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Year</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Type</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Position</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Quantity</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Fitment</Data></Cell>'
-                   '</Row>')
-            
-            for chunk in self.outlier_analysis_chunks_list:
-                if chunk.asset_problems_count > 0:
-                    try:
-                        error_file = f"{chunk.cache_file}_assetProblems.txt"
-                        if os.path.exists(error_file):
-                            with open(error_file, 'r', encoding='utf-8') as ef:
-                                for line in ef:
-                                    fields = line.strip().split('\t')
-                                    if len(fields) >= 11:
-                                        f.write('<Row>')
-                                        for field in fields[:11]:
-                                            f.write(f'<Cell><Data ss:Type="String">{escape_xml(field)}</Data></Cell>')
-                                        f.write('</Row>')
-                    except:
-                        pass
-            
-            f.write('</Table></Worksheet>')
+        # Individual app errors and outlier warnings are read back from the per-chunk fragment files,
+        # one fragment at a time, so only a single chunk's rows are held in memory
+        for chunks, worksheets in ((self.individual_analysis_chunks_list, _INDIVIDUAL_ERROR_WORKSHEETS),
+                                   (self.outlier_analysis_chunks_list, _OUTLIER_WORKSHEETS)):
+            for worksheet in worksheets:
+                if getattr(self, worksheet[0]) > 0:
+                    _write_fragment_worksheet(f, chunks, *worksheet[1:])
         
         # Fitment Logic Problems
         if self.fitment_logic_problems_count > 0:
-            f.write('<Worksheet ss:Name="Fitment Logic Problems">'
-                   '<Table ss:ExpandedColumnCount="11" x:FullColumns="1" x:FullRows="1" ss:DefaultRowHeight="15">'
-                   '<Row>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Problem Group</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">App Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Base Vehicle Id</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Make</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Model</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Year</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part Type</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Position</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Quantity</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Part</Data></Cell>'
-                   '<Cell ss:StyleID="s65"><Data ss:Type="String">Fitment</Data></Cell>'
-                   '</Row>')
-            
-            for group_id, apps in self.fitment_problem_groups_app_lists.items():
-                for app in apps:
-                    f.write('<Row>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(group_id)}</Data></Cell>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(str(app.id))}</Data></Cell>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(str(app.basevehicle_id))}</Data></Cell>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(vcdb.nice_make_of_basevid(app.basevehicle_id))}</Data></Cell>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(vcdb.nice_model_of_basevid(app.basevehicle_id))}</Data></Cell>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(str(vcdb.nice_year_of_basevid(app.basevehicle_id)))}</Data></Cell>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(pcdb.nice_parttype(app.parttype_id))}</Data></Cell>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(pcdb.nice_position(app.position_id))}</Data></Cell>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(str(app.quantity))}</Data></Cell>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(app.part)}</Data></Cell>')
-                    f.write(f'<Cell><Data ss:Type="String">{escape_xml(app.nice_full_fitment_string(vcdb, qdb))}</Data></Cell>')
-                    f.write('</Row>')
-            
-            f.write('</Table></Worksheet>')
\ No newline at end of file
+            # Apps in a problem group mostly share basevehicle, parttype and position, so look each id up once
+            vehicle_cache: Dict[int, Tuple[str, str, str, str]] = {}
+            parttype_cache: Dict[int, str] = {}
+            position_cache: Dict[int, str] = {}
+            
+            def fitment_rows():
+                for group_id, apps in self.fitment_problem_groups_app_lists.items():
+                    for app in apps:
+                        vehicle = vehicle_cache.get(app.basevehicle_id)
+                        if vehicle is None:
+                            vehicle = vehicle_cache[app.basevehicle_id] = (
+                                str(app.basevehicle_id),
+                                vcdb.nice_make_of_basevid(app.basevehicle_id),
+                                vcdb.nice_model_of_basevid(app.basevehicle_id),
+                                str(vcdb.nice_year_of_basevid(app.basevehicle_id)))
+                        parttype = parttype_cache.get(app.parttype_id)
+                        if parttype is None:
+                            parttype = parttype_cache[app.parttype_id] = pcdb.nice_parttype(app.parttype_id)
+                        position = position_cache.get(app.position_id)
+                        if position is None:
+                            position = position_cache[app.position_id] = pcdb.nice_position(app.position_id)
+                        yield ((group_id, str(app.id)) + vehicle +
+                               (parttype, position, str(app.quantity), app.part,
+                                app.nice_full_fitment_string(vcdb, qdb)))
+            
+            _emit_worksheet(f, "Fitment Logic Problems", ("Problem Group",) + _APP_COLUMNS + _FITMENT_COLUMNS,
+                            fitment_rows())
@@ -4,11 +4,109 @@ Basic test script for ACES Inspector CLI Python port
 Demonstrates core functionality without requiring actual database files
 """
 
-from autocare import ACES, VCdb, PCdb, Qdb, App, Asset, VCdbAttribute, QdbQualifier
+from autocare import ACES, VCdb, PCdb, Qdb, App, Asset, VCdbAttribute, QdbQualifier, BaseVehicle, AnalysisChunk
+from datetime import datetime
 import tempfile
 import os
 
 
+# Small ACES document exercising the parser edge cases pinned by the regression tests below:
+# attributes out of canonical order, a duplicate BaseVehicle, an unparseable attribute id and
+# quantity, qualifier parameters, empty notes, and a footer record count.
+REGRESSION_ACES_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<ACES version="4.2">
+    <Header>
+        <Company>Test &amp; Co</Company>
+        <SenderName>Test Sender</SenderName>
+        <DocumentTitle>Regression</DocumentTitle>
+    </Header>
+    <App action="A" id="10" ref="R1" validate="no">
+        <BaseVehicle id="111"/>
+        <BaseVehicle id="222"/>
+        <EngineBase id="456"/>
+        <SubModel id="7"/>
+        <DriveType id="bad"/>
+        <Qual id="3"><param value="x"/><param value="y"/><text>with x y</text></Qual>
+        <Note>first note</Note>
+        <Note/>
+        <Note>second note</Note>
+        <Qty>4</Qty>
+        <PartType id="1896"/>
+        <MfrLabel>Label</MfrLabel>
+        <Position id="22"/>
+        <Part BrandAAIAID="BBVL">PART-1</Part>
+        <AssetName>img1</AssetName>
+        <AssetItemOrder>2</AssetItemOrder>
+        <AssetItemRef>ref1</AssetItemRef>
+    </App>
+    <App action="D" id="11">
+        <BaseVehicle id="333"/>
+        <Qty>x</Qty>
+        <PartType id="5"/>
+        <Part>PART-2</Part>
+    </App>
+    <Asset action="A" id="5">
+        <AssetName>img1</AssetName>
+        <BaseVehicle id="111"/>
+        <Note>asset note</Note>
+    </Asset>
+    <Footer>
+        <RecordCount>2</RecordCount>
+    </Footer>
+</ACES>'''
+
+REGRESSION_EXPORT_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<ACES version="4.2">
+  <Header>
+    <Company>Test Co</Company>
+    <SenderName>Test Sender</SenderName>
+    <SenderPhone></SenderPhone>
+    <TransferDate></TransferDate>
+    <DocumentTitle>Regression</DocumentTitle>
+    <EffectiveDate></EffectiveDate>
+    <SubmissionType>FULL</SubmissionType>
+    <VcdbVersionDate></VcdbVersionDate>
+    <QdbVersionDate></QdbVersionDate>
+    <PcdbVersionDate></PcdbVersionDate>
+  </Header>
+  <App action="A" id="10" ref="R1" validate="no">
+    <BaseVehicle id="111"></BaseVehicle>
+    <SubModel id="7"></SubModel>
+    <EngineBase id="456"></EngineBase>
+    <Qual id="3">
+      <param value="x"></param>
+      <param value="y"></param>
+      <text></text>
+    </Qual>
+    <Note>first note</Note>
+    <Note>second note</Note>
+    <Qty>4</Qty>
+    <PartType id="1896"></PartType>
+    <MfrLabel>Label</MfrLabel>
+    <Position id="22"></Position>
+    <Part BrandAAIAID="BBVL">PART-1</Part>
+    <AssetName>img1</AssetName>
+    <AssetItemOrder>2</AssetItemOrder>
+    <AssetItemRef>ref1</AssetItemRef>
+  </App>
+  <App action="D" id="11">
+    <BaseVehicle id="333"></BaseVehicle>
+    <Qty>0</Qty>
+    <PartType id="5"></PartType>
+    <Part>PART-2</Part>
+  </App>
+  <Asset action="A" id="5">
+    <BaseVehicle id="111"></BaseVehicle>
+    <Note>asset note</Note>
+    <AssetName>img1</AssetName>
+  </Asset>
+  <Footer>
+    <RecordCount>2</RecordCount>
+  </Footer>
+</ACES>
+'''
+
+
 def test_basic_classes():
     """Test basic class instantiation and functionality"""
     print("Testing basic class instantiation...")
@@ -150,8 +248,8 @@ def test_xml_parsing():
 </ACES>'''
     
     # Write to temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as f:
-        f.write(test_xml)
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.xml', delete=False, buffering=1 << 20) as f:
+        f.write(test_xml.encode('utf-8'))
         temp_file = f.name
     
     try:
@@ -201,6 +299,241 @@ def test_xml_parsing():
         os.unlink(temp_file)
 
 
+def test_xml_parsing_namespaced_root():
+    """Test that a default-namespaced ACES root imports cleanly instead of failing"""
+    print("\nTesting XML parsing with a namespaced root...")
+    
+    test_xml = ('<?xml version="1.0" encoding="UTF-8"?>'
+                '<ACES xmlns="http://www.autocare.org" version="4.2">'
+                '<Header><Company>Test Company</Company></Header>'
+                '<App action="A" id="1"><BaseVehicle id="1"/><Part>P1</Part></App>'
+                '</ACES>')
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.xml', delete=False) as f:
+        f.write(test_xml.encode('utf-8'))
+        temp_file = f.name
+    
+    try:
+        aces = ACES()
+        result = aces.import_xml(temp_file, "", True, False, {}, {}, "/tmp", False)
+        assert result == ""
+        assert aces.successful_import == True
+        assert aces.version == "4.2"
+        assert len(aces.apps) == 0
+        print("✓ Namespaced root imported without error")
+    finally:
+        os.unlink(temp_file)
+
+
+def test_xml_parsing_internal_entities():
+    """Test that internal DTD entities are expanded and external ones are rejected"""
+    print("\nTesting XML parsing with DTD entities...")
+    
+    test_xml = ('<?xml version="1.0" encoding="UTF-8"?>'
+                '<!DOCTYPE ACES [<!ENTITY co "Acme Parts">]>'
+                '<ACES version="4.2">'
+                '<Header><Company>&co;</Company></Header>'
+                '<App action="A" id="1"><BaseVehicle id="1"/><Note>fits &co; kit</Note><Part>P1</Part></App>'
+                '</ACES>')
+    external_xml = ('<?xml version="1.0" encoding="UTF-8"?>'
+                    '<!DOCTYPE ACES [<!ENTITY ext SYSTEM "file:///etc/hostname">]>'
+                    '<ACES version="4.2"><Header><Company>&ext;</Company></Header></ACES>')
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.xml', delete=False) as f:
+        f.write(test_xml.encode('utf-8'))
+        temp_file = f.name
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.xml', delete=False) as f:
+        f.write(external_xml.encode('utf-8'))
+        external_file = f.name
+    
+    try:
+        aces = ACES()
+        result = aces.import_xml(temp_file, "", True, False, {}, {}, "/tmp", False)
+        assert result == ""
+        assert aces.company == "Acme Parts"
+        assert aces.apps[0].notes == ["fits Acme Parts kit"]
+        print("✓ Internal entities expanded")
+        
+        aces = ACES()
+        result = aces.import_xml(external_file, "", True, False, {}, {}, "/tmp", False)
+        assert "Failed to import" in result
+        assert aces.successful_import == False
+        print("✓ External entities rejected")
+    finally:
+        os.unlink(temp_file)
+        os.unlink(external_file)
+
+
+def generate_assessment(aces, vcdb, pcdb, qdb, temp_dir):
+    """Generate an assessment file in temp_dir and return its contents"""
+    file_path = os.path.join(temp_dir, "assessment.xml")
+    aces.generate_assessment_file(file_path, vcdb, pcdb, qdb, 0.0, 0.0, 0, 0, 0, 0,
+                                  datetime.now(), temp_dir)
+    with open(file_path, encoding='utf-8') as f:
+        return f.read()
+
+
+def worksheet_row(*values):
+    """Return the markup of a worksheet row of string cells"""
+    return '<Row>' + ''.join('<Cell><Data ss:Type="String">%s</Data></Cell>' % value for value in values) + '</Row>'
+
+
+def test_assessment_fitment_null_fields():
+    """Test that None and non-string lookup values render as cells in the assessment file"""
+    print("\nTesting assessment fitment sheet with NULL lookup values...")
+    
+    vcdb = VCdb()
+    pcdb = PCdb()
+    qdb = Qdb()
+    vcdb.vcdb_basevehicle_dict[10] = BaseVehicle(10, 1, 2, 2001)
+    vcdb.mfr_dict[1] = None  # NULL MfrName in the VCdb
+    pcdb.parttypes[100] = 1234  # non-string name
+    
+    app = App()
+    app.id = 7
+    app.basevehicle_id = 10
+    app.parttype_id = 100
+    app.quantity = 1
+    app.part = "A&B"
+    
+    aces = ACES()
+    aces.fitment_logic_problems_count = 1
+    aces.fitment_problem_groups_app_lists["1"] = [app]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        content = generate_assessment(aces, vcdb, pcdb, qdb, temp_dir)
+    
+    assert worksheet_row("1", "7", "10", "", "Unknown Model", "2001", "1234", "Unknown", "1", "A&amp;B", "") in content
+    assert content.endswith('</Workbook>')
+    
+    print("✓ NULL lookup values rendered as empty cells")
+
+
+def test_assessment_fragment_empty_last_field():
+    """Test that fragment rows whose last field is empty still reach the worksheet"""
+    print("\nTesting fragment rows with an empty trailing field...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.makedirs(os.path.join(temp_dir, "AiFragments"))
+        chunk = AnalysisChunk()
+        chunk.id = 1
+        chunk.cache_file = os.path.join(temp_dir, "AiFragments", "hash")
+        chunk.basevehicleids_errors_count = 2
+        with open(chunk.cache_file + "_invalidBasevehicles1.txt", 'w', encoding='utf-8') as f:
+            f.write("Invalid basevehicle\t1\t999\t\t\t\tAir Filter\tFront\t1\tP1\t\n")
+            f.write("Invalid basevehicle\t2\t998\t\t\t\tAir Filter\tFront\t1\tP2\tEngineBase:5\n")
+        
+        aces = ACES()
+        aces.basevehicleids_errors_count = 2
+        aces.individual_analysis_chunks_list.append(chunk)
+        content = generate_assessment(aces, VCdb(), PCdb(), Qdb(), temp_dir)
+    
+    assert worksheet_row("Invalid basevehicle", "1", "999", "", "", "", "Air Filter", "Front", "1", "P1", "") in content
+    assert worksheet_row("Invalid basevehicle", "2", "998", "", "", "", "Air Filter", "Front", "1", "P2", "EngineBase:5") in content
+    
+    print("✓ Rows with an empty last field are kept")
+
+
+def import_regression_xml():
+    """Import REGRESSION_ACES_XML and return the ACES object"""
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.xml', delete=False) as f:
+        f.write(REGRESSION_ACES_XML.encode('utf-8'))
+        temp_file = f.name
+    try:
+        aces = ACES()
+        result = aces.import_xml(temp_file, "", True, False, {}, {}, "/tmp", False)
+        assert result == ""
+        return aces
+    finally:
+        os.unlink(temp_file)
+
+
+def test_xml_import_regression():
+    """Test that XML import results (and app hashes) stay exactly as they are"""
+    print("\nTesting XML import regression...")
+    
+    aces = import_regression_xml()
+    assert aces.version == "4.2"
+    assert aces.company == "Test & Co"
+    assert aces.document_title == "Regression"
+    assert aces.footer_record_count == 2
+    assert aces.xml_app_node_count == 2
+    assert aces.xml_asset_node_count == 1
+    assert len(aces.apps) == 2
+    
+    app = aces.apps[0]
+    assert (app.id, app.action, app.reference, app.validate) == (10, "A", "R1", False)
+    assert app.basevehicle_id == 111  # first BaseVehicle wins
+    assert (app.quantity, app.parttype_id, app.position_id) == (4, 1896, 22)
+    assert (app.part, app.brand, app.mfr_label) == ("PART-1", "BBVL", "Label")
+    assert (app.asset, app.asset_item_order, app.asset_item_ref) == ("img1", 2, "ref1")
+    assert [(attr.name, attr.value) for attr in app.vcdb_attributes] == [("SubModel", 7), ("EngineBase", 456)]
+    assert [(qual.qualifier_id, qual.qualifier_parameters) for qual in app.qdb_qualifiers] == [(3, ["x", "y"])]
+    assert app.notes == ["first note", "second note"]
+    assert app.app_hash() == "3cd12e14c1b004420ee3b205f0439fc0"
+    
+    app = aces.apps[1]
+    assert (app.id, app.action, app.validate, app.basevehicle_id) == (11, "D", True, 333)
+    assert (app.quantity, app.parttype_id, app.position_id, app.part) == (0, 5, 0, "PART-2")
+    assert app.vcdb_attributes == [] and app.qdb_qualifiers == [] and app.notes == []
+    assert app.app_hash() == "f0a57b43d67e7fc25c948efdbad175ac"
+    
+    assert len(aces.assets) == 1
+    asset = aces.assets[0]
+    assert (asset.id, asset.action, asset.basevehicle_id, asset.asset_name) == (5, "A", 111, "img1")
+    assert asset.notes == ["asset note"]
+    
+    print("✓ XML import results unchanged")
+
+
+def test_export_xml_regression():
+    """Test that export_xml_apps output stays byte-for-byte the same"""
+    print("\nTesting XML export regression...")
+    
+    aces = import_regression_xml()
+    aces.company = "Test Co"
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "export.xml")
+        assert aces.export_xml_apps(file_path, "FULL", "", False) == ""
+        with open(file_path, 'rb') as f:
+            content = f.read()
+    
+    assert content == REGRESSION_EXPORT_XML.encode('utf-8')
+    
+    print("✓ XML export output unchanged")
+
+
+def test_assessment_fragment_rendering():
+    """Test fragment rows: short rows skipped, extra fields dropped, special characters escaped"""
+    print("\nTesting assessment fragment rendering...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.makedirs(os.path.join(temp_dir, "AiFragments"))
+        chunk = AnalysisChunk()
+        chunk.cache_file = os.path.join(temp_dir, "AiFragments", "hash")
+        chunk.qty_outlier_count = 4
+        with open(chunk.cache_file + "_qtyOutliers.txt", 'w', encoding='utf-8') as f:
+            f.write("too\tshort\n")
+            f.write("Qty <outlier>\t1\t10\tFord & Sons\tF-150\t2001\tAir \"Filter\"\tFront's\t9\tP1\tEngineBase:5\n")
+            f.write("Qty outlier\t2\t10\t\t\t\t\t\t9\tP2\tfitment\textra\tfields\n")
+            f.write("Qty outlier\t3\t10\t\t\t\t\t\t9\tP3\t\n")
+        
+        aces = ACES()
+        aces.qty_outlier_count = 4
+        aces.outlier_analysis_chunks_list.append(chunk)
+        content = generate_assessment(aces, VCdb(), PCdb(), Qdb(), temp_dir)
+    
+    sheet = content[content.index('<Worksheet ss:Name="Quantity Outliers">'):]
+    sheet = sheet[:sheet.index('</Table>')]
+    rows = sheet.split('<Row>')[2:]  # skip the table preamble and the header row
+    assert ['<Row>' + row for row in rows] == [
+        worksheet_row("Qty &lt;outlier&gt;", "1", "10", "Ford &amp; Sons", "F-150", "2001",
+                      "Air &quot;Filter&quot;", "Front&apos;s", "9", "P1", "EngineBase:5"),
+        worksheet_row("Qty outlier", "2", "10", "", "", "", "", "", "9", "P2", "fitment"),
+        worksheet_row("Qty outlier", "3", "10", "", "", "", "", "", "9", "P3", ""),
+    ]
+    
+    print("✓ Fragment rows rendered as expected")
+
+
 def main():
     """Run all tests"""
     print("ACES Inspector CLI Python Port - Basic Tests")
@@ -211,6 +544,13 @@ def main():
         test_app_functionality()
         test_asset_functionality()
         test_xml_parsing()
+        test_xml_parsing_namespaced_root()
+        test_xml_parsing_internal_entities()
+        test_assessment_fitment_null_fields()
+        test_assessment_fragment_empty_last_field()
+        test_xml_import_regression()
+        test_export_xml_regression()
+        test_assessment_fragment_rendering()
         
         print("\n" + "=" * 50)
         print("✅ All basic tests passed!")